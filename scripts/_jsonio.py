@@ -0,0 +1,52 @@
+"""
+_jsonio.py -- JSON helpers shared by the scripts in this directory.
+
+Uses orjson when it is installed and falls back to the stdlib ``json`` module
+otherwise. The documents these scripts emit (strings, ints, bools, lists and
+dicts) encode byte-identically to ``json.dumps(data, indent=2)`` either way.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def json_loads(text: str) -> Any:
+    """Parse JSON with orjson when available, else (or on any error) with json."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # Re-parse for json's error message and its extensions (NaN, Infinity).
+            pass
+    return json.loads(text)
+
+
+def dumps_indented(data: Any) -> bytes:
+    """Encode ``data`` as ``json.dumps(data, indent=2)`` would, as ASCII bytes."""
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits
+        else:
+            # orjson writes raw UTF-8 where json escapes non-ASCII as \uXXXX.
+            if payload.isascii():
+                return payload
+    return json.dumps(data, indent=2).encode("ascii")
+
+
+def print_json(data: Any) -> None:
+    """Write ``data`` to stdout as JSON indented by two spaces."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps_indented(data) + b"\n")
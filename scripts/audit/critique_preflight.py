@@ -1,16 +1,54 @@
 import argparse
+import functools
+import hashlib
 import json
 import os
+import pickle
 import re
 import subprocess
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TextIO, cast
 
 import jsonschema
 
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = ROOT / ".cache" / "preflight"
+
+# Validators keyed by schema content hash; building one walks the meta-schema.
+_VALIDATOR_CACHE: dict[str, Any] = {}
+
+_NUMERIC_RE = re.compile(r"\b\d+(?:\.\d+)?%?\b")
+_DELETE_ASCII_DIGITS = str.maketrans("", "", "0123456789")
+_THRESHOLD_RE = re.compile(r"([0-9]+(?:\.[0-9]+)?)")
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+_DEFAULT_REGEX_FLAGS = re.compile("").flags
+
+
+@functools.cache
+def path_exists(path: str) -> bool:
+    """Memoized existence check; V1 and R15 stat overlapping scope files."""
+    return os.path.exists(path)
 
 
 def to_abs(path_str: str) -> Path:
@@ -78,13 +116,45 @@ def now_utc() -> str:
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    if ORJSON_AVAILABLE:
+        data = orjson.loads(path.read_bytes())
+    else:
+        with path.open("r", encoding="utf-8") as fh:
+            data = json.load(fh)
     if not isinstance(data, dict):
         raise ValueError(f"Expected JSON object in {path}, got {type(data).__name__}")
     return cast(dict[str, Any], data)
 
 
+def load_json_cached(path: Path) -> dict[str, Any]:
+    """Load a JSON artifact, reusing a pickled copy while the file is unchanged.
+
+    There is one pickle per artifact path; it stores the (mtime_ns, size) stamp it
+    was built from and is overwritten when the artifact changes.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_path = CACHE_DIR / f"{hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()}.pkl"
+    try:
+        with cache_path.open("rb") as fh:
+            cached_stamp, cached = pickle.load(fh)
+        if cached_stamp == stamp and isinstance(cached, dict):
+            return cast(dict[str, Any], cached)
+    except (OSError, pickle.UnpicklingError, EOFError, TypeError, ValueError):
+        pass
+
+    data = load_json(path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as fh:
+            pickle.dump((stamp, data), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+    return data
+
+
 def run_cmd(cmd: list[str], cwd: Path) -> tuple[int, str, str]:
     proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
     return proc.returncode, proc.stdout, proc.stderr
@@ -108,25 +178,92 @@ def record(
     return item
 
 
-def iter_non_code_lines(text: str, exclude_code_fences: bool = True) -> list[tuple[int, str]]:
-    lines = text.splitlines()
+def iter_non_code_lines(
+    lines: Iterable[str], exclude_code_fences: bool = True
+) -> Iterator[tuple[int, str]]:
     in_fence = False
-    out: list[tuple[int, str]] = []
 
-    for idx, line in enumerate(lines, start=1):
+    for idx, raw in enumerate(lines, start=1):
+        line = raw.rstrip("\n")
         stripped = line.strip()
         if stripped.startswith("```"):
             in_fence = not in_fence
             continue
         if exclude_code_fences and in_fence:
             continue
-        out.append((idx, line))
-    return out
+        yield idx, line
+
+
+class PlanReadError(Exception):
+    """The plan file failed to read or decode part-way through streaming."""
+
+
+def iter_plan_lines(fh: TextIO) -> Iterator[str]:
+    try:
+        yield from fh
+    except (OSError, UnicodeDecodeError) as exc:
+        raise PlanReadError(exc) from exc
+
+
+def build_substring_matcher(words: Iterable[str]) -> Callable[[str], bool]:
+    """Return a predicate that is true when any of ``words`` occurs in its argument."""
+    unique = sorted(set(words), key=len, reverse=True)
+    if not unique:
+        return lambda _text: False
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for word in unique:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    search = re.compile("|".join(re.escape(word) for word in unique)).search
+    return lambda text: search(text) is not None
+
+
+def build_regex_matcher(patterns: list[str]) -> Callable[[str], bool]:
+    """Return a predicate that is true when any of ``patterns`` searches its argument.
+
+    Patterns are merged into one alternation when that can't change their meaning:
+    inline global flags and backreferences (whose group numbers shift) keep the
+    per-pattern scan, as does any combination that fails to compile.
+    """
+    compiled = [re.compile(pat) for pat in patterns]
+    if not compiled:
+        return lambda _text: False
+    if all(
+        rx.flags == _DEFAULT_REGEX_FLAGS and _BACKREF_RE.search(rx.pattern) is None
+        for rx in compiled
+    ):
+        try:
+            search = re.compile("|".join(f"(?:{pat})" for pat in patterns)).search
+        except re.error:
+            pass
+        else:
+            return lambda text: search(text) is not None
+    return lambda text: any(rx.search(text) for rx in compiled)
+
+
+def schema_key(schema: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def get_validator(schema: dict[str, Any]) -> Any:
+    key = schema_key(schema)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema)
+        _VALIDATOR_CACHE[key] = validator
+    return validator
 
 
 def check_schema(spec: dict[str, Any], schema: dict[str, Any]) -> dict[str, Any]:
     try:
-        jsonschema.validate(spec, schema)
+        validator = get_validator(schema)
+        error = jsonschema.exceptions.best_match(validator.iter_errors(spec))
+        if error is not None:
+            raise error
         return record("SCHEMA", "PASS", "hard-mandatory", "Manifest validates against schema")
     except Exception as exc:
         return record("SCHEMA", "FAIL", "hard-mandatory", f"Schema validation error: {exc}")
@@ -162,20 +299,19 @@ def check_regex_compile(spec: dict[str, Any]) -> dict[str, Any]:
 def check_file_existence(scope_files: list[str]) -> list[dict[str, Any]]:
     results: list[dict[str, Any]] = []
     for f in scope_files:
-        path = ROOT / f
-        if path.exists():
+        if path_exists(str(ROOT / f)):
             results.append(record("V1", "PASS", "hard-mandatory", "Scope file exists", file=f))
         else:
             results.append(record("V1", "FAIL", "hard-mandatory", "Scope file not found", file=f))
     return results
 
 
-def check_matrix(scope_files: list[str], matrix: dict[str, Any]) -> list[dict[str, Any]]:
+def check_matrix(scope_set: frozenset[str], matrix: dict[str, Any]) -> list[dict[str, Any]]:
     results: list[dict[str, Any]] = []
-    scope_set = set(scope_files)
 
     for vector, file_map in matrix.items():
-        if not re.match(r"^V\d+$", vector):
+        # Vector ids are "V" + digits; isdecimal() matches the \d class exactly.
+        if not (vector.startswith("V") and vector[1:].isdecimal()):
             continue
 
         keys = {k for k in file_map if k != "_doc"}
@@ -229,8 +365,44 @@ def check_matrix(scope_files: list[str], matrix: dict[str, Any]) -> list[dict[st
     return results
 
 
+def read_head_sha(root: Path) -> str | None:
+    """Resolve HEAD from the .git directory without spawning git; None if unsure."""
+    try:
+        git_dir = root / ".git"
+        if git_dir.is_file():
+            # Worktree/submodule: ".git" is a "gitdir: <path>" pointer file.
+            pointer = git_dir.read_text(encoding="utf-8").strip()
+            if not pointer.startswith("gitdir: "):
+                return None
+            git_dir = (root / pointer[len("gitdir: ") :]).resolve()
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return head or None
+        ref = head[len("ref: ") :]
+        common_dir = git_dir
+        if (git_dir / "commondir").is_file():
+            common_dir = (git_dir / (git_dir / "commondir").read_text("utf-8").strip()).resolve()
+        for base in dict.fromkeys((git_dir, common_dir)):
+            ref_path = base / ref
+            if ref_path.is_file():
+                return ref_path.read_text(encoding="utf-8").strip() or None
+        packed = common_dir / "packed-refs"
+        if packed.is_file():
+            for line in packed.read_text(encoding="utf-8").splitlines():
+                sha, _, name = line.partition(" ")
+                if name == ref:
+                    return sha
+    except OSError:
+        return None
+    return None
+
+
 def check_matter_map_freshness(matter_map: dict[str, Any]) -> dict[str, Any]:
-    rc, out, err = run_cmd(["git", "rev-parse", "HEAD"], ROOT)
+    head_sha = read_head_sha(ROOT)
+    if head_sha is not None:
+        rc, out, err = 0, head_sha, ""
+    else:
+        rc, out, err = run_cmd(["git", "rev-parse", "HEAD"], ROOT)
     if rc != 0:
         return record(
             "R23",
@@ -258,9 +430,8 @@ def check_matter_map_freshness(matter_map: dict[str, Any]) -> dict[str, Any]:
 
 
 def check_matter_map_scope_parity(
-    scope_files: list[str], matter_map: dict[str, Any]
+    scope_set: frozenset[str], matter_map: dict[str, Any]
 ) -> dict[str, Any]:
-    scope_set = set(scope_files)
     map_scope = matter_map.get("_meta", {}).get("scope_files", [])
     map_set = set(map_scope) if isinstance(map_scope, list) else set()
 
@@ -286,17 +457,20 @@ def check_matter_map_scope_parity(
     )
 
 
-def check_r02_numeric_methodology(spec: dict[str, Any], plan_text: str) -> dict[str, Any]:
+def check_r02_numeric_methodology(
+    spec: dict[str, Any], plan_lines: Iterable[str]
+) -> dict[str, Any]:
     rule = next((r for r in spec.get("rules", []) if r.get("id") == "R02"), None)
     if not rule:
         return record("R02", "UNVERIFIED", "soft-mandatory", "R02 not present in manifest")
 
     verify = rule.get("verify", {})
-    keywords = [k.lower() for k in verify.get("claim_keywords", [])]
-    markers = [m.lower() for m in verify.get("methodology_markers", [])]
+    keywords = tuple(k.lower() for k in verify.get("claim_keywords", []))
+    markers = tuple(m.lower() for m in verify.get("methodology_markers", []))
     exclude_code = bool(verify.get("exclude_in_code_fences", True))
-    exclude_line_patterns = verify.get("exclude_line_patterns", [])
-    compiled_excludes = [re.compile(pat) for pat in exclude_line_patterns]
+    is_excluded = build_regex_matcher(verify.get("exclude_line_patterns", []))
+    has_keyword = build_substring_matcher(keywords)
+    has_marker = build_substring_matcher(markers)
 
     if not keywords:
         return record(
@@ -306,10 +480,9 @@ def check_r02_numeric_methodology(spec: dict[str, Any], plan_text: str) -> dict[
             "R02 missing claim_keywords",
         )
 
-    numeric_re = re.compile(r"\b\d+(?:\.\d+)?%?\b")
     offenders: list[dict[str, Any]] = []
 
-    for line_no, line in iter_non_code_lines(plan_text, exclude_code_fences=exclude_code):
+    for line_no, line in iter_non_code_lines(plan_lines, exclude_code_fences=exclude_code):
         stripped = line.strip()
         if (
             not stripped
@@ -318,15 +491,19 @@ def check_r02_numeric_methodology(spec: dict[str, Any], plan_text: str) -> dict[
             or set(stripped) <= {"-", "|", " "}
         ):
             continue
-        if any(rx.search(line) for rx in compiled_excludes):
+        # Cheapest common rejection first: most prose lines carry no number.
+        # translate() is only a safe digit test for ASCII; \d also matches other scripts.
+        if line.isascii() and len(line.translate(_DELETE_ASCII_DIGITS)) == len(line):
+            continue
+        if not _NUMERIC_RE.search(line):
+            continue
+        if is_excluded(line):
             continue
 
         lower = line.lower()
-        if not numeric_re.search(line):
+        if not has_keyword(lower):
             continue
-        if not any(k in lower for k in keywords):
-            continue
-        if any(m in lower for m in markers):
+        if has_marker(lower):
             continue
         if "sha256:" in lower:
             continue
@@ -350,6 +527,13 @@ def check_r02_numeric_methodology(spec: dict[str, Any], plan_text: str) -> dict[
     )
 
 
+def count_http_exception_lines(path: Path) -> int:
+    """Count lines containing ``raise HTTPException`` (same tally as ``rg -n``)."""
+    # Binary lines split on b"\n" only, as rg does.
+    with path.open("rb") as fh:
+        return sum(1 for line in fh if b"raise HTTPException" in line)
+
+
 def check_r15_ast_vs_regex(
     spec: dict[str, Any], matter_map: dict[str, Any]
 ) -> list[dict[str, Any]]:
@@ -359,7 +543,7 @@ def check_r15_ast_vs_regex(
 
     threshold = 10.0
     pass_condition = rule.get("verify", {}).get("pass_condition", "")
-    m = re.search(r"([0-9]+(?:\.[0-9]+)?)", pass_condition)
+    m = _THRESHOLD_RE.search(pass_condition)
     if m:
         threshold = float(m.group(1))
 
@@ -377,7 +561,7 @@ def check_r15_ast_vs_regex(
 
     for file in required_files:
         abs_file = ROOT / file
-        if not abs_file.exists():
+        if not path_exists(str(abs_file)):
             results.append(
                 record("R15", "FAIL", "hard-mandatory", "V84 required file missing", file=file)
             )
@@ -392,22 +576,20 @@ def check_r15_ast_vs_regex(
         else:
             ast_count = 0
 
-        rc, out, err = run_cmd(["rg", "-n", "raise HTTPException", str(abs_file)], ROOT)
-        if rc not in (0, 1):
+        try:
+            regex_count = count_http_exception_lines(abs_file)
+        except OSError as exc:
             results.append(
                 record(
                     "R15",
                     "UNVERIFIED",
                     "hard-mandatory",
-                    "Regex command failed for V84 cross-check",
+                    "Unable to read file for V84 regex cross-check",
                     file=file,
-                    command='rg -n "raise HTTPException" <file>',
-                    exit_code=rc,
-                    stderr=err.strip(),
+                    error=str(exc),
                 )
             )
             continue
-        regex_count = 0 if rc == 1 else len([ln for ln in out.splitlines() if ln.strip()])
 
         denom = max(ast_count, regex_count, 1)
         delta_pct = abs(ast_count - regex_count) * 100.0 / denom
@@ -445,9 +627,30 @@ def check_r15_ast_vs_regex(
 
 def write_evidence(items: list[dict[str, Any]], evidence_path: Path) -> None:
     evidence_path.parent.mkdir(parents=True, exist_ok=True)
-    with evidence_path.open("w", encoding="utf-8") as fh:
-        for item in items:
-            fh.write(json.dumps(item) + "\n")
+    if ORJSON_AVAILABLE:
+        payload = [orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE) for item in items]
+    else:
+        # Same compact UTF-8 lines orjson writes, so the file doesn't depend on it.
+        payload = [
+            json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+            for item in items
+        ]
+    with evidence_path.open("wb") as fh:
+        fh.writelines(payload)
+
+
+def report_load_error(
+    spec_path: Path,
+    schema_path: Path,
+    matter_map_path: Path,
+    evidence_path: Path,
+    exc: BaseException,
+) -> int:
+    print(
+        "PREFLIGHT ERROR: failed to load artifacts:",
+        f"spec={spec_path} schema={schema_path} map={matter_map_path} evidence={evidence_path} err={exc}",
+    )
+    return 2
 
 
 def main() -> int:
@@ -455,33 +658,46 @@ def main() -> int:
     spec_path, schema_path, matter_map_path, evidence_path = resolve_paths(args)
 
     try:
-        spec = load_json(spec_path)
-        schema = load_json(schema_path)
-        matter_map = load_json(matter_map_path)
+        spec = load_json_cached(spec_path)
+        schema = load_json_cached(schema_path)
+        matter_map = load_json_cached(matter_map_path)
         plan_path = Path(spec["plan_file"])
-        plan_text = plan_path.read_text(encoding="utf-8")
+        plan_fh = plan_path.open("r", encoding="utf-8", buffering=65536)
     except Exception as exc:
-        print(
-            "PREFLIGHT ERROR: failed to load artifacts:",
-            f"spec={spec_path} schema={schema_path} map={matter_map_path} evidence={evidence_path} err={exc}",
-        )
-        return 2
+        return report_load_error(spec_path, schema_path, matter_map_path, evidence_path, exc)
 
-    scope_files = (
-        spec.get("scope", {}).get("primary", [])
-        + spec.get("scope", {}).get("secondary", [])
-        + spec.get("scope", {}).get("tertiary", [])
+    scope = spec.get("scope", {})
+    scope_files = list(
+        chain(scope.get("primary", []), scope.get("secondary", []), scope.get("tertiary", []))
     )
+    scope_set = frozenset(scope_files)
     evidence: list[dict[str, Any]] = []
 
-    evidence.append(check_schema(spec, schema))
-    evidence.append(check_regex_compile(spec))
-    evidence.extend(check_file_existence(scope_files))
-    evidence.extend(check_matrix(scope_files, spec.get("vector_file_matrix", {})))
-    evidence.append(check_matter_map_scope_parity(scope_files, matter_map))
-    evidence.append(check_matter_map_freshness(matter_map))
-    evidence.append(check_r02_numeric_methodology(spec, plan_text))
-    evidence.extend(check_r15_ast_vs_regex(spec, matter_map))
+    # Checks are independent; the git subprocess and file reads overlap in threads.
+    # Results are gathered in submission order so evidence output stays stable.
+    with plan_fh, ThreadPoolExecutor(max_workers=8) as ex:
+        futures: list[Future[Any]] = [
+            ex.submit(check_schema, spec, schema),
+            ex.submit(check_regex_compile, spec),
+            ex.submit(check_file_existence, scope_files),
+            ex.submit(check_matrix, scope_set, spec.get("vector_file_matrix", {})),
+            ex.submit(check_matter_map_scope_parity, scope_set, matter_map),
+            ex.submit(check_matter_map_freshness, matter_map),
+            ex.submit(check_r02_numeric_methodology, spec, iter_plan_lines(plan_fh)),
+            ex.submit(check_r15_ast_vs_regex, spec, matter_map),
+        ]
+        for fut in futures:
+            try:
+                result = fut.result()
+            except PlanReadError as exc:
+                # The plan is streamed by R02, so read/decode errors surface here.
+                return report_load_error(
+                    spec_path, schema_path, matter_map_path, evidence_path, exc
+                )
+            if isinstance(result, list):
+                evidence.extend(result)
+            else:
+                evidence.append(result)
 
     write_evidence(evidence, evidence_path)
 
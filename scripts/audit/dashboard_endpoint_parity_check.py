@@ -19,11 +19,12 @@ from __future__ import annotations
 
 import argparse
 import re
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackendRoute:
     method: str
     path: str
@@ -34,16 +35,24 @@ _BACKEND_DECORATOR_RE = re.compile(
     r"^@app\.(get|post|put|delete|patch|websocket)\(\s*['\"]([^'\"]+)['\"]",
     re.IGNORECASE,
 )
+_TEMPLATE_PARAM_RE = re.compile(r"\$\{[^}]+\}")
+_FETCH_STR_RE = re.compile(r"fetch\(\s*['\"](/[^'\"]+)['\"]")
+_FETCH_TMPL_RE = re.compile(r"fetch\(\s*`(/[^`]+)`")
+_WS_RE = re.compile(r"/ws\b")
 
 
 def _extract_backend_routes(backend_file: Path) -> list[BackendRoute]:
     routes: list[BackendRoute] = []
-    for lineno, line in enumerate(backend_file.read_text(encoding="utf-8").splitlines(), 1):
-        m = _BACKEND_DECORATOR_RE.match(line.strip())
-        if not m:
-            continue
-        method, path = m.group(1).upper(), m.group(2)
-        routes.append(BackendRoute(method=method, path=path, lineno=lineno))
+    with backend_file.open("r", encoding="utf-8", buffering=65536) as fh:
+        for lineno, line in enumerate(fh, 1):
+            # Decorator lines are rare; skip the regex for everything else.
+            if "@" not in line:
+                continue
+            m = _BACKEND_DECORATOR_RE.match(line.strip())
+            if not m:
+                continue
+            method, path = m.group(1).upper(), m.group(2)
+            routes.append(BackendRoute(method=method, path=path, lineno=lineno))
     return routes
 
 
@@ -51,7 +60,7 @@ def _normalize_frontend_path(raw: str) -> str:
     # Drop query string
     raw = raw.split("?", 1)[0]
     # Normalize dynamic template `${x}` into `{param}` so it matches FastAPI path params.
-    raw = re.sub(r"\$\{[^}]+\}", "{param}", raw)
+    raw = _TEMPLATE_PARAM_RE.sub("{param}", raw)
     return raw
 
 
@@ -61,40 +70,56 @@ def _extract_frontend_paths(frontend_file: Path) -> set[str]:
     paths: set[str] = set()
 
     # fetch('/api/...') and fetch("/api/...")
-    for m in re.finditer(r"fetch\(\s*['\"](/[^'\"]+)['\"]", text):
+    for m in _FETCH_STR_RE.finditer(text):
         paths.add(_normalize_frontend_path(m.group(1)))
 
     # fetch(`/api/...${x}...`)
-    for m in re.finditer(r"fetch\(\s*`(/[^`]+)`", text):
+    for m in _FETCH_TMPL_RE.finditer(text):
         paths.add(_normalize_frontend_path(m.group(1)))
 
     # WebSocket URL construction: `${protocol}//${window.location.host}/ws`
     # We consider `/ws` part of parity.
-    if re.search(r"/ws\b", text):
+    if _WS_RE.search(text):
         paths.add("/ws")
 
     # Only dashboard API (and ws) are in-scope.
     return {p for p in paths if p.startswith("/api/") or p == "/ws"}
 
 
-def _path_matches(pattern: str, concrete: str) -> bool:
+def _split_segments(path: str) -> list[str]:
+    return [s for s in path.strip("/").split("/") if s]
+
+
+def _is_param(segment: str) -> bool:
+    return segment.startswith("{") and segment.endswith("}")
+
+
+def _segments_match(p_segs: list[str], c_segs: list[str]) -> bool:
     """
-    Compare two paths where either side can contain FastAPI-style `{param}` segments.
+    Compare two split paths where either side can contain FastAPI-style `{param}` segments.
     """
-    p_segs = [s for s in pattern.strip("/").split("/") if s]
-    c_segs = [s for s in concrete.strip("/").split("/") if s]
     if len(p_segs) != len(c_segs):
         return False
     for p, c in zip(p_segs, c_segs, strict=True):
-        if p.startswith("{") and p.endswith("}"):
-            continue
-        if c.startswith("{") and c.endswith("}"):
+        if _is_param(p) or _is_param(c):
             continue
         if p != c:
             return False
     return True
 
 
+def _compile_backend_alternation(routes: list[list[str]]) -> re.Pattern[str] | None:
+    """
+    Build one regex matching any backend route, with `{param}` segments as `[^/]+`.
+    """
+    if not routes:
+        return None
+    bodies = [
+        "/" + "/".join("[^/]+" if _is_param(s) else re.escape(s) for s in segs) for segs in routes
+    ]
+    return re.compile("|".join(f"(?:{body})" for body in bodies))
+
+
 def run(frontend_file: Path, backend_file: Path) -> int:
     if not frontend_file.exists():
         print(f"[ERROR] Frontend file not found: {frontend_file}")
@@ -106,11 +131,24 @@ def run(frontend_file: Path, backend_file: Path) -> int:
     frontend_paths = sorted(_extract_frontend_paths(frontend_file))
     backend_routes = _extract_backend_routes(backend_file)
 
-    backend_paths = {r.path for r in backend_routes}
+    # Only paths with the same segment count can match; split each backend path once.
+    backend_by_len: dict[int, list[list[str]]] = defaultdict(list)
+    for bp in {r.path for r in backend_routes}:
+        segs = _split_segments(bp)
+        backend_by_len[len(segs)].append(segs)
+    backend_re = _compile_backend_alternation(
+        [segs for bucket in backend_by_len.values() for segs in bucket]
+    )
     missing: list[str] = []
 
     for fp in frontend_paths:
-        if any(_path_matches(fp, bp) for bp in backend_paths):
+        fp_segs = _split_segments(fp)
+        if backend_re is not None and not any(_is_param(s) for s in fp_segs):
+            # Literal frontend path: one match against every backend route at once.
+            if backend_re.fullmatch("/" + "/".join(fp_segs)):
+                continue
+        elif any(_segments_match(fp_segs, bp) for bp in backend_by_len.get(len(fp_segs), [])):
+            # Frontend `{param}` segments are wildcards too, so compare segment-wise.
             continue
         missing.append(fp)
 
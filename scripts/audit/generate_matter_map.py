@@ -5,21 +5,36 @@ import json
 import os
 import subprocess
 import sys
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_INCLUDE_PREFIXES = ("src/", "tests/", "scripts/")
-
-
-def get_file_hash(filepath: Path) -> str:
-    """Compute SHA256 hash of file content."""
-    sha256_hash = hashlib.sha256()
-    with filepath.open("rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+# Bump when _parse_source output changes so stale cached entries are ignored.
+_TOOL_VERSION = "4"
+CACHE_DIR = ROOT / ".cache" / "matter_map" / _TOOL_VERSION
+# file -> last commit SHA, filled once by _ensure_last_sha_index.
+_LAST_SHA: dict[str, str] | None = None
+_LAST_SHA_LOCK = threading.Lock()
+# Below this many files, process-pool startup costs more than it saves.
+_PARALLEL_MIN_FILES = 8
+# UTF-8 encoded line boundaries that str.splitlines() honours besides "\n".
+_EXTRA_LINE_BREAKS = (
+    b"\r",
+    b"\x0b",
+    b"\x0c",
+    b"\x1c",
+    b"\x1d",
+    b"\x1e",
+    b"\xc2\x85",
+    b"\xe2\x80\xa8",
+    b"\xe2\x80\xa9",
+)
 
 
 def get_repo_head_sha() -> str:
@@ -39,6 +54,9 @@ def get_repo_head_sha() -> str:
 
 def get_file_last_commit_sha(filepath: str) -> str:
     """Get the git SHA of the last commit touching a file."""
+    index = _ensure_last_sha_index()
+    if filepath in index:
+        return index[filepath]
     try:
         result = subprocess.run(
             ["git", "log", "-1", "--format=%H", filepath],
@@ -52,174 +70,361 @@ def get_file_last_commit_sha(filepath: str) -> str:
         return "unknown"
 
 
-def _extract_decorators(node: ast.AST) -> list[str]:
-    decorators: list[str] = []
-    if not hasattr(node, "decorator_list"):
-        return decorators
-    for decorator in node.decorator_list:
-        if isinstance(decorator, ast.Name):
-            decorators.append(decorator.id)
-        elif isinstance(decorator, ast.Attribute):
-            decorators.append(decorator.attr)
-        elif isinstance(decorator, ast.Call):
-            if isinstance(decorator.func, ast.Name):
-                decorators.append(decorator.func.id)
-            elif isinstance(decorator.func, ast.Attribute):
-                decorators.append(decorator.func.attr)
-    return decorators
-
-
-def _extract_http_status_code(exc_call: ast.Call) -> int | None:
-    for keyword in exc_call.keywords:
+def _ensure_last_sha_index(files: list[str] | None = None) -> dict[str, str]:
+    """Build the file -> last-commit map once, from a single ``git log`` pass.
+
+    ``files`` limits the pass to those paths; lookups that miss the index fall
+    back to a per-file ``git log`` in ``get_file_last_commit_sha``.
+    """
+    global _LAST_SHA
+    with _LAST_SHA_LOCK:
+        if _LAST_SHA is None:
+            _LAST_SHA = _build_last_commit_index(files)
+        return _LAST_SHA
+
+
+def _build_last_commit_index(files: list[str] | None) -> dict[str, str]:
+    if files is not None and not files:
+        return {}
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "-c",
+                "core.quotePath=false",
+                "log",
+                "--no-renames",
+                "--name-only",
+                "--format=%x00%H",
+                "--",
+                *(files or ()),
+            ],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except Exception:
+        return {}
+
+    index: dict[str, str] = {}
+    current_sha = ""
+    for line in result.stdout.splitlines():
+        if line.startswith("\x00"):
+            current_sha = line[1:]
+        elif line and line not in index:
+            # git log is newest-first, so the first SHA seen per path wins.
+            index[line] = current_sha
+    return index
+
+
+# Hoisted node classes for the collector's hot paths. Parsed nodes are always
+# exact instances, so ``type(node) is X`` replaces the isinstance() MRO walk.
+_AST_NAME = ast.Name
+_AST_ATTRIBUTE = ast.Attribute
+_AST_CALL = ast.Call
+_AST_CONSTANT = ast.Constant
+_AST_ASYNC_FUNCTION_DEF = ast.AsyncFunctionDef
+_FUNCTION_DEF_TYPES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+
+# Nodes with nothing of interest below them: never expanded during traversal.
+_LEAF_NODE_TYPES = frozenset(
+    {
+        ast.Name,
+        ast.Constant,
+        ast.Pass,
+        ast.alias,
+        *ast.expr_context.__subclasses__(),
+        *ast.operator.__subclasses__(),
+        *ast.boolop.__subclasses__(),
+        *ast.cmpop.__subclasses__(),
+        *ast.unaryop.__subclasses__(),
+    }
+)
+
+
+class _MatterCollector:
+    """Collect matter-map facts from every node in a module.
+
+    Traversal is breadth-first in the same order as ``ast.walk``, so when names
+    collide (a method and a module-level function, say) the same entry wins and
+    exceptions keep the same order.
+    """
+
+    def __init__(self) -> None:
+        self.functions: dict[str, Any] = {}
+        self.classes: dict[str, Any] = {}
+        # Insertion-ordered set: duplicates collapse as they are found.
+        self.imports: dict[str, None] = {}
+        self.exceptions: list[dict[str, Any]] = []
+        self.patterns: dict[str, list[dict[str, Any]]] = {
+            "async_db_calls": [],
+            "ownership_predicates": [],
+        }
+
+    def collect(self, tree: ast.AST) -> None:
+        handlers: dict[type[ast.AST], Callable[[Any], None]] = {
+            ast.FunctionDef: self._record_function,
+            ast.AsyncFunctionDef: self._record_function,
+            ast.ClassDef: self._record_class,
+            ast.Import: self._record_import,
+            ast.ImportFrom: self._record_import_from,
+            ast.Raise: self._record_raise,
+            ast.Await: self._record_await,
+        }
+        leaf_types = _LEAF_NODE_TYPES
+        iter_child_nodes = ast.iter_child_nodes
+        queue: deque[ast.AST] = deque([tree])
+        popleft = queue.popleft
+        push = queue.extend
+        while queue:
+            node = popleft()
+            node_type = type(node)
+            if node_type in leaf_types:
+                continue
+            if node_type is ast.Attribute:
+                # Only the value can nest anything of interest; ctx is a marker node.
+                queue.append(node.value)  # type: ignore[attr-defined]
+                continue
+            handler = handlers.get(node_type)
+            if handler is not None:
+                handler(node)
+            push(iter_child_nodes(node))
+
+    def _record_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        decorators: list[str] = []
+        for decorator in node.decorator_list:
+            decorator_type = type(decorator)
+            if decorator_type is _AST_CALL:
+                decorator = decorator.func  # type: ignore[attr-defined]
+                decorator_type = type(decorator)
+            if decorator_type is _AST_NAME:
+                decorators.append(decorator.id)  # type: ignore[attr-defined]
+            elif decorator_type is _AST_ATTRIBUTE:
+                decorators.append(decorator.attr)  # type: ignore[attr-defined]
+        self.functions[node.name] = {
+            "lineno": node.lineno,
+            "end_lineno": node.end_lineno,
+            "args": [arg.arg for arg in node.args.args],
+            "decorators": decorators,
+            "is_async": type(node) is _AST_ASYNC_FUNCTION_DEF,
+        }
+
+    def _record_class(self, node: ast.ClassDef) -> None:
+        bases: list[str] = []
+        for base in node.bases:
+            base_type = type(base)
+            if base_type is _AST_NAME:
+                bases.append(base.id)  # type: ignore[attr-defined]
+            elif base_type is _AST_ATTRIBUTE:
+                bases.append(base.attr)  # type: ignore[attr-defined]
+        methods = [item.name for item in node.body if type(item) in _FUNCTION_DEF_TYPES]  # type: ignore[attr-defined]
+        self.classes[node.name] = {
+            "lineno": node.lineno,
+            "end_lineno": node.end_lineno,
+            "bases": bases,
+            "methods": methods,
+        }
+
+    def _record_import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports[alias.name] = None
+
+    def _record_import_from(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self.imports[node.module] = None
+
+    def _record_raise(self, node: ast.Raise) -> None:
+        exc = node.exc
+        if (
+            type(exc) is not _AST_CALL
+            or type(exc.func) is not _AST_NAME  # type: ignore[union-attr]
+            or exc.func.id != "HTTPException"  # type: ignore[union-attr]
+        ):
+            return
+        status_code = None
+        for keyword in exc.keywords:  # type: ignore[union-attr]
+            if (
+                keyword.arg == "status_code"
+                and type(keyword.value) is _AST_CONSTANT
+                and isinstance(keyword.value.value, int)  # type: ignore[attr-defined]
+            ):
+                status_code = keyword.value.value  # type: ignore[attr-defined]
+                break
+        else:
+            args = exc.args  # type: ignore[union-attr]
+            if args and type(args[0]) is _AST_CONSTANT and isinstance(args[0].value, int):
+                status_code = args[0].value
+        self.exceptions.append(
+            {"type": "HTTPException", "lineno": node.lineno, "status_code": status_code}
+        )
+
+    def _record_await(self, node: ast.Await) -> None:
+        value = node.value
         if (
-            keyword.arg == "status_code"
-            and isinstance(keyword.value, ast.Constant)
-            and isinstance(keyword.value.value, int)
+            type(value) is _AST_CALL
+            and type(value.func) is _AST_ATTRIBUTE  # type: ignore[attr-defined]
+            and value.func.attr == "execute"  # type: ignore[attr-defined]
         ):
-            return keyword.value.value
+            self.patterns["async_db_calls"].append(
+                {"lineno": node.lineno, "pattern": "await db.execute(...)"}
+            )
+
+
+def _cache_path(file_hash: str) -> Path:
+    return CACHE_DIR / file_hash[:2] / f"{file_hash[2:]}.json"
+
+
+def _stamp_path(filepath: Path) -> Path:
+    key = hashlib.sha1(str(filepath).encode(), usedforsecurity=False).hexdigest()
+    return CACHE_DIR / "stamps" / key[:2] / f"{key[2:]}.json"
+
+
+def _read_cache_json(cache_path: Path) -> dict[str, Any] | None:
+    try:
+        with cache_path.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_cache_json(cache_path: Path, data: dict[str, Any]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
+def _parse_content(filepath: Path) -> dict[str, Any]:
+    """Content-derived matter map entry, cached on disk by content hash.
+
+    ``git_sha`` is path-specific, so callers add it after this returns.
+    """
+    # Cheap gate: an unchanged (mtime_ns, size) stamp points straight at the
+    # cached entry, so unmodified files are only stat'ed, never read or hashed.
+    st = filepath.stat()
+    stamp_path = _stamp_path(filepath)
+    stamp = _read_cache_json(stamp_path)
     if (
-        exc_call.args
-        and isinstance(exc_call.args[0], ast.Constant)
-        and isinstance(exc_call.args[0].value, int)
+        stamp is not None
+        and stamp.get("mtime_ns") == st.st_mtime_ns
+        and stamp.get("size") == st.st_size
     ):
-        return exc_call.args[0].value
-    return None
+        entry = _read_cache_json(_cache_path(str(stamp.get("hash", ""))))
+        if entry is not None:
+            return entry
+
+    raw = filepath.read_bytes()
+    file_hash = hashlib.sha256(raw).hexdigest()
+    entry = _read_cache_json(_cache_path(file_hash))
+    if entry is None:
+        entry = _parse_source(raw, file_hash, str(filepath))
+        _write_cache_json(_cache_path(file_hash), entry)
+    _write_cache_json(
+        stamp_path, {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": file_hash}
+    )
+    return entry
+
+
+def _count_lines(raw: bytes) -> int:
+    """Line count with ``str.splitlines()`` semantics, without decoding in the common case."""
+    if any(sep in raw for sep in _EXTRA_LINE_BREAKS):
+        return len(raw.decode("utf-8", errors="replace").splitlines())
+    if not raw:
+        return 0
+    return raw.count(b"\n") + (0 if raw.endswith(b"\n") else 1)
+
+
+def _parse_one(scope_file: tuple[str, Path]) -> tuple[str, dict[str, Any] | None]:
+    """Worker entry point: content-derived entry, or None if the file is missing."""
+    relpath, abs_path = scope_file
+    try:
+        return relpath, _parse_content(abs_path)
+    except FileNotFoundError:
+        return relpath, None
 
 
-def parse_file(filepath: Path, relpath: str) -> dict[str, Any]:
-    """Parse a Python file into a structured matter map entry."""
-    with filepath.open(encoding="utf-8") as f:
-        source = f.read()
+def _parse_source(raw: bytes, file_hash: str, filename: str) -> dict[str, Any]:
+    if not raw:
+        # Empty modules (typically bare __init__.py files) have nothing to parse.
+        return {
+            "line_count": 0,
+            "functions": {},
+            "classes": {},
+            "imports": [],
+            "exceptions": [],
+            "patterns": {"async_db_calls": [], "ownership_predicates": []},
+            "hash": file_hash,
+        }
 
     try:
-        tree = ast.parse(source)
+        # Parsing bytes lets the compiler honour BOMs and coding cookies.
+        tree = ast.parse(raw, filename=filename)
     except (SyntaxError, ValueError):
         # Not a Python file or invalid syntax - return basic metadata
         return {
-            "line_count": len(source.splitlines()),
-            "hash": get_file_hash(filepath),
-            "git_sha": get_file_last_commit_sha(relpath),
+            "line_count": _count_lines(raw),
+            "hash": file_hash,
             "error": "not_python_or_syntax_error",
         }
 
-    functions: dict[str, Any] = {}
-    classes: dict[str, Any] = {}
-    imports: list[str] = []
-    exceptions: list[dict[str, Any]] = []
-    patterns: dict[str, list[dict[str, Any]]] = {
-        "async_db_calls": [],
-        "ownership_predicates": [],
-    }
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            functions[node.name] = {
-                "lineno": node.lineno,
-                "end_lineno": node.end_lineno,
-                "args": [arg.arg for arg in node.args.args],
-                "decorators": _extract_decorators(node),
-                "is_async": isinstance(node, ast.AsyncFunctionDef),
-            }
-            continue
-
-        if isinstance(node, ast.ClassDef):
-            bases: list[str] = []
-            for base in node.bases:
-                if isinstance(base, ast.Name):
-                    bases.append(base.id)
-                elif isinstance(base, ast.Attribute):
-                    bases.append(base.attr)
-            methods = [
-                item.name
-                for item in node.body
-                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
-            ]
-            classes[node.name] = {
-                "lineno": node.lineno,
-                "end_lineno": node.end_lineno,
-                "bases": bases,
-                "methods": methods,
-            }
-            continue
-
-        if isinstance(node, ast.Import):
-            imports.extend(alias.name for alias in node.names)
-            continue
-
-        if isinstance(node, ast.ImportFrom) and node.module:
-            imports.append(node.module)
-            continue
-
-        if isinstance(node, ast.Raise) and isinstance(node.exc, ast.Call):
-            if isinstance(node.exc.func, ast.Name) and node.exc.func.id == "HTTPException":
-                exceptions.append(
-                    {
-                        "type": "HTTPException",
-                        "lineno": node.lineno,
-                        "status_code": _extract_http_status_code(node.exc),
-                    }
-                )
-            continue
-
-        if (
-            isinstance(node, ast.Await)
-            and isinstance(node.value, ast.Call)
-            and isinstance(node.value.func, ast.Attribute)
-            and node.value.func.attr == "execute"
-        ):
-            patterns["async_db_calls"].append(
-                {"lineno": node.lineno, "pattern": "await db.execute(...)"}
-            )
+    collector = _MatterCollector()
+    collector.collect(tree)
 
     return {
-        "line_count": len(source.splitlines()),
-        "functions": functions,
-        "classes": classes,
-        "imports": sorted(set(imports)),
-        "exceptions": exceptions,
-        "patterns": patterns,
-        "hash": get_file_hash(filepath),
-        "git_sha": get_file_last_commit_sha(relpath),
+        "line_count": _count_lines(raw),
+        "functions": collector.functions,
+        "classes": collector.classes,
+        "imports": sorted(collector.imports),
+        "exceptions": collector.exceptions,
+        "patterns": collector.patterns,
+        "hash": file_hash,
     }
 
 
-def _default_scope_files(include_prefixes: tuple[str, ...]) -> list[str]:
-    """Discover tracked Python files for standard code areas."""
-    files: list[str] = []
+def _in_scope(file: str, include_prefixes: tuple[str, ...]) -> bool:
+    return file.endswith(".py") and "__pycache__" not in file and file.startswith(include_prefixes)
+
+
+def _default_scope_files(include_prefixes: tuple[str, ...]) -> list[tuple[str, Path]]:
+    """Discover tracked Python files for standard code areas as (relpath, abs_path)."""
+    files: set[str] | None = None
+    byte_prefixes = tuple(os.fsencode(prefix) for prefix in include_prefixes)
     try:
-        tracked = subprocess.run(
-            ["git", "ls-files", "--", "*.py"],
+        # Tracked and untracked-but-not-ignored files in a single git call, filtered
+        # as raw bytes while lines stream in; only surviving paths are decoded.
+        with subprocess.Popen(
+            ["git", "ls-files", "--cached", "--others", "--exclude-standard", "--", "*.py"],
             cwd=ROOT,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        untracked = subprocess.run(
-            ["git", "ls-files", "--others", "--exclude-standard", "--", "*.py"],
-            cwd=ROOT,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        files = [
-            line.strip()
-            for line in (tracked.stdout + "\n" + untracked.stdout).splitlines()
-            if line.strip()
-        ]
-    except Exception:
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ) as proc:
+            assert proc.stdout is not None
+            listed = {
+                os.fsdecode(path)
+                for path in (line.strip() for line in proc.stdout)
+                if path.endswith(b".py")
+                and b"__pycache__" not in path
+                and path.startswith(byte_prefixes)
+            }
+        if proc.returncode == 0:
+            files = listed
+    except OSError:
+        pass
+
+    if files is None:
         # Fallback when git is unavailable: walk the repository tree.
+        files = set()
         for path in ROOT.rglob("*.py"):
             rel = path.relative_to(ROOT).as_posix()
-            files.append(rel)
+            if _in_scope(rel, include_prefixes):
+                files.add(rel)
 
-    filtered = [
-        file
-        for file in files
-        if file.endswith(".py")
-        and "__pycache__" not in file
-        and any(file.startswith(prefix) for prefix in include_prefixes)
-    ]
-    return sorted(set(filtered))
+    return [(file, ROOT / file) for file in sorted(files)]
 
 
 def parse_args() -> argparse.Namespace:
@@ -252,37 +457,63 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _collect_entries(
+    matter_map: dict[str, Any],
+    results: Iterable[tuple[str, dict[str, Any] | None]],
+) -> None:
+    for relpath, entry in results:
+        if entry is None:
+            matter_map[relpath] = {"error": "file_not_found"}
+        else:
+            entry["git_sha"] = get_file_last_commit_sha(relpath)
+            matter_map[relpath] = entry
+
+
 def main() -> None:
     args = parse_args()
     include_prefixes = tuple(args.include_prefix) if args.include_prefix else DEFAULT_INCLUDE_PREFIXES
-    files = args.files if args.files else _default_scope_files(include_prefixes)
-
-    matter_map: dict[str, Any] = {
-        "_meta": {
-            "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "git_sha": get_repo_head_sha(),
-            "scope_files": files,
-            "include_prefixes": list(include_prefixes),
-        }
-    }
+    generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Git calls are subprocess-bound, so run them on threads alongside discovery
+    # and the parse pool instead of one after another.
+    with ThreadPoolExecutor(max_workers=2) as git_pool:
+        head_sha_future = git_pool.submit(get_repo_head_sha)
+        if args.files:
+            scope = [(file, ROOT / file) for file in args.files]
+        else:
+            scope = _default_scope_files(include_prefixes)
+        files = [relpath for relpath, _ in scope]
+        last_sha_future = git_pool.submit(_ensure_last_sha_index, files)
 
-    for filepath in files:
-        abs_path = ROOT / filepath
-        if os.path.exists(abs_path):
-            matter_map[filepath] = parse_file(abs_path, filepath)
+        if len(files) < _PARALLEL_MIN_FILES:
+            results = list(map(_parse_one, scope))
         else:
-            matter_map[filepath] = {"error": "file_not_found"}
+            with ProcessPoolExecutor() as executor:
+                chunksize = max(1, len(files) // ((os.cpu_count() or 1) * 4))
+                results = list(executor.map(_parse_one, scope, chunksize=chunksize))
+
+        matter_map: dict[str, Any] = {
+            "_meta": {
+                "generated_at": generated_at,
+                "git_sha": head_sha_future.result(),
+                "scope_files": files,
+                "include_prefixes": list(include_prefixes),
+            }
+        }
+        last_sha_future.result()
+        _collect_entries(matter_map, results)
 
-    payload = json.dumps(matter_map, indent=2) + "\n"
     if args.output == "-":
-        sys.stdout.write(payload)
+        json.dump(matter_map, sys.stdout, indent=2)
+        sys.stdout.write("\n")
     else:
         output_path = Path(args.output)
         if not output_path.is_absolute():
             output_path = ROOT / output_path
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as out_f:
-            out_f.write(payload)
+        # Buffered stream: json.dump writes chunks rather than one full-size string.
+        with output_path.open("w", encoding="utf-8", buffering=1 << 16) as out_f:
+            json.dump(matter_map, out_f, indent=2)
+            out_f.write("\n")
 
 
 if __name__ == "__main__":
@@ -14,8 +14,10 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import contextlib
+import importlib.util
+import io
 import re
-import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -28,31 +30,49 @@ class Finding:
     detail: str
 
 
-def _run(cmd: list[str], cwd: Path) -> tuple[int, str, str]:
-    proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
-    return proc.returncode, proc.stdout, proc.stderr
+# Heuristic: only enforce integration contracts when the plan is discussing boundary work.
+_BOUNDARY_KEYWORDS = (
+    "caller",
+    "callee",
+    "request->",
+    "request →",
+    "response_model",
+    "jwt",
+    "idor",
+    "ownership",
+    "route reality",
+    "include_router",
+)
+# Plain substring semantics (no word boundaries), matched in one case-insensitive pass.
+_BOUNDARY_RE = re.compile("|".join(map(re.escape, _BOUNDARY_KEYWORDS)), re.IGNORECASE)
+_INTEGRATION_CONTRACT_RE = re.compile(r"(?i)\bintegration\s+contract\b")
+
+
+def _run_route_checker(
+    route_checker: Path, plan_file: Path, project_root: Path
+) -> tuple[int, str, str]:
+    """Run route_parity_check's CLI in-process; returns (rc, stdout, stderr)."""
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        module_spec = importlib.util.spec_from_file_location("route_parity_check", route_checker)
+        if module_spec is None or module_spec.loader is None:
+            return 2, "", f"ERROR: cannot load {route_checker}"
+        module = importlib.util.module_from_spec(module_spec)
+        sys.modules[module_spec.name] = module
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            module_spec.loader.exec_module(module)
+            rc = module.main(["--plan-file", str(plan_file), "--project-root", str(project_root)])
+    except Exception as exc:
+        return 2, out.getvalue(), f"ERROR: route parity check failed: {exc}"
+    return rc, out.getvalue(), err.getvalue()
 
 
 def _has_integration_contracts(plan_text: str) -> bool:
-    return bool(re.search(r"(?i)\bintegration\s+contract\b", plan_text))
+    return _INTEGRATION_CONTRACT_RE.search(plan_text) is not None
 
 
 def _plan_mentions_boundaries(plan_text: str) -> bool:
-    # Heuristic: only enforce integration contracts when the plan is discussing boundary work.
-    keywords = [
-        "caller",
-        "callee",
-        "request->",
-        "request →",
-        "response_model",
-        "jwt",
-        "idor",
-        "ownership",
-        "route reality",
-        "include_router",
-    ]
-    lower = plan_text.lower()
-    return any(k in lower for k in keywords)
+    return _BOUNDARY_RE.search(plan_text) is not None
 
 
 def check(plan_file: Path, project_root: Path, checks: set[str]) -> tuple[int, list[Finding]]:
@@ -92,17 +112,7 @@ def check(plan_file: Path, project_root: Path, checks: set[str]) -> tuple[int, l
         # V106 enforcement: route parity check (best-effort; empty route claims should PASS).
         route_checker = project_root / "scripts" / "audit" / "route_parity_check.py"
         if route_checker.exists():
-            rc, out, err = _run(
-                [
-                    sys.executable,
-                    str(route_checker),
-                    "--plan-file",
-                    str(plan_file),
-                    "--project-root",
-                    str(project_root),
-                ],
-                cwd=project_root,
-            )
+            rc, out, err = _run_route_checker(route_checker, plan_file, project_root)
             if rc == 2:
                 findings.append(
                     Finding(
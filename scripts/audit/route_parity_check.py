@@ -21,16 +21,69 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import bisect
+import os
 import re
 import sys
-from collections.abc import Sequence
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 
 PROJECT_ROOT_DEFAULT = Path(__file__).resolve().parents[2]
 BACKEND_API_DIR = Path("backend") / "api"
 BACKEND_MAIN = Path("backend") / "main.py"
 
+_DOUBLE_SLASH_RE = re.compile(r"/{2,}")
+_ESCAPED_PARAM_RE = re.compile(r"\\\{[^\\\}]+\\\}")
+# 1) Backticked paths like `/api/webhooks/whatsapp`
+_BACKTICK_RE = re.compile(r"`(/[^`\s]+)`")
+# 2) METHOD /path patterns
+_METHOD_PATH_RE = re.compile(r"\b(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\s+(/[^`\s]+)")
+# 3) Bare paths (NOT inside code fences). Intentionally strict:
+# - must start at start-of-line or after non-path char (prevents matching "backend/api/foo.py")
+# - must not be immediately preceded by "/" (prevents matching within "https://")
+# - must be a plausible route with at least one segment after the namespace
+_BARE_RE = re.compile(
+    r"(?<![A-Za-z0-9_.-])(?<!/)"
+    r"(?P<path>/(?:api|webhooks|position-statements|cases|client-documents)"
+    r"(?:/[A-Za-z0-9_~{}:-]+)+)"
+)
+# Literal namespace prefixes _BARE_RE requires; lines without one skip the regex.
+_BARE_NAMESPACE_TOKENS = (
+    "/api/",
+    "/webhooks/",
+    "/position-statements/",
+    "/cases/",
+    "/client-documents/",
+)
+_FILE_SUFFIXES = (".py", ".ts", ".tsx", ".md", ".json", ".yml", ".yaml", ".txt")
+# router = APIRouter(prefix="/api/foo", ...)
+_ROUTER_PREFIX_RE = re.compile(
+    r"APIRouter\s*\(\s*[^)]*?\bprefix\s*=\s*['\"]([^'\"]+)['\"]", re.DOTALL
+)
+# Matches @router.get("/path") even if the string literal is on the next line.
+_ROUTE_DECO_RE = re.compile(
+    r"@\s*router\.(get|post|put|delete|patch|options|head|websocket)\s*\(\s*['\"]([^'\"]+)['\"]",
+    re.IGNORECASE | re.MULTILINE,
+)
+# app.include_router(messaging_webhooks.router, prefix="/api", ...)
+_INCLUDE_ROUTER_RE = re.compile(
+    r"include_router\s*\(\s*([A-Za-z0-9_\.]+)\s*,\s*(?:[^)]*?\bprefix\s*=\s*['\"]([^'\"]+)['\"])?",
+    re.DOTALL,
+)
+_APP_DECO_RE = re.compile(
+    r"@\s*app\.(get|post|put|delete|patch|options|head|websocket)\s*\(\s*['\"]([^'\"]+)['\"]",
+    re.IGNORECASE,
+)
+# Never descended into by the fallback scanner (virtualenvs, caches, VCS, JS deps).
+_FALLBACK_PRUNED_DIRS = frozenset({"__pycache__", ".venv", "venv", ".git", "node_modules"})
+# Cheap byte-level prefilters: files without a decorator marker are never decoded.
+_ROUTER_MARKER_RE = re.compile(rb"@\s*router\.", re.IGNORECASE)
+_APP_MARKER_RE = re.compile(rb"@\s*app\.", re.IGNORECASE)
+# Same-line annotations that allow a missing route claim (tags are case-sensitive,
+# the frontend "navigate to" heuristic is not); one search covers all of them.
+_ALLOWED_MISSING_RE = re.compile(r"\[(?:NEW|FRONTEND|EXTERNAL|DEAD)\]|\b(?i:navigate\s+to)\b")
+
 
 @dataclass(frozen=True)
 class RouteClaim:
@@ -57,8 +110,28 @@ class RouteIndex:
     routes_by_module: dict[str, list[RouteDef]]
     # all composed final paths (include_router prefix + module route path)
     final_paths: set[str]
-    # compiled matchers to support {param} placeholders
-    final_path_regexes: list[tuple[str, re.Pattern[str]]]
+    # Derived lookup structures for match_claim (built in __post_init__).
+    sorted_paths: list[str] = field(init=False, repr=False)
+    paths_by_last_segment: dict[str, list[str]] = field(init=False, repr=False)
+    param_routes: list[str] = field(init=False, repr=False)
+    param_regex: re.Pattern[str] | None = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.sorted_paths = sorted(self.final_paths)
+        self.paths_by_last_segment = {}
+        for p in self.sorted_paths:
+            self.paths_by_last_segment.setdefault(p.rsplit("/", 1)[1], []).append(p)
+        # Literal routes can only match themselves, which the exact-set lookup already
+        # covers, so only {param} routes go into one alternation; group N <-> route N.
+        # A single match() then replaces one compiled pattern per route.
+        self.param_routes = []
+        bodies: list[str] = []
+        for p in self.sorted_paths:
+            body = _route_to_regex_body(p)
+            if body != re.escape(p):
+                self.param_routes.append(p)
+                bodies.append(f"({body})$")
+        self.param_regex = re.compile("^(?:" + "|".join(bodies) + ")") if bodies else None
 
 
 def _norm_path(p: str) -> str:
@@ -66,7 +139,7 @@ def _norm_path(p: str) -> str:
     if not p.startswith("/"):
         p = "/" + p
     # collapse double slashes
-    p = re.sub(r"/{2,}", "/", p)
+    p = _DOUBLE_SLASH_RE.sub("/", p)
     # remove trailing slash except root
     if p != "/" and p.endswith("/"):
         p = p[:-1]
@@ -79,54 +152,56 @@ def _join(prefix: str, path: str) -> str:
     return _norm_path(prefix.rstrip("/") + "/" + path.lstrip("/"))
 
 
-def _route_to_regex(path: str) -> re.Pattern[str]:
-    # Convert "/foo/{id}/bar" to a matcher that accepts any non-slash segment for params.
-    escaped = re.escape(path)
-    escaped = re.sub(r"\\\{[^\\\}]+\\\}", r"[^/]+", escaped)
-    return re.compile(rf"^{escaped}$")
+def _join_normalized(prefix: str, path: str) -> str:
+    # Same result as _join() when both sides already went through _norm_path (or prefix is "").
+    # _norm_path can leave trailing whitespace before a stripped slash; let _join handle that.
+    if path[-1:].isspace():
+        return _join(prefix, path)
+    if not prefix or prefix == "/":
+        return path
+    if path == "/":
+        return prefix
+    return prefix + path
+
+
+def _route_to_regex_body(path: str) -> str:
+    # Convert "/foo/{id}/bar" to a pattern that accepts any non-slash segment for params.
+    return _ESCAPED_PARAM_RE.sub(r"[^/]+", re.escape(path))
+
+
+def _first_with_prefix(sorted_paths: list[str], prefix: str) -> str | None:
+    i = bisect.bisect_left(sorted_paths, prefix)
+    if i < len(sorted_paths) and sorted_paths[i].startswith(prefix):
+        return sorted_paths[i]
+    return None
 
 
-def _iter_non_code_lines(text: str) -> list[tuple[int, str]]:
-    lines = text.splitlines()
+def _iter_non_code_lines(text: str) -> Iterator[tuple[int, str]]:
     in_fence = False
-    out: list[tuple[int, str]] = []
-    for idx, line in enumerate(lines, start=1):
-        stripped = line.strip()
-        if stripped.startswith("```"):
+    for idx, line in enumerate(text.splitlines(), start=1):
+        if line.lstrip().startswith("```"):
             in_fence = not in_fence
             continue
         if in_fence:
             continue
-        out.append((idx, line))
-    return out
+        yield idx, line
 
 
 def extract_route_claims(plan_text: str) -> list[RouteClaim]:
     claims: list[RouteClaim] = []
     seen: set[tuple[str, int]] = set()
 
-    # 1) Backticked paths like `/api/webhooks/whatsapp`
-    backtick = re.compile(r"`(/[^`\s]+)`")
-    # 2) METHOD /path patterns
-    method_path = re.compile(r"\b(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\s+(/[^`\s]+)")
-    # 3) Bare paths (NOT inside code fences). Intentionally strict:
-    # - must start at start-of-line or after non-path char (prevents matching "backend/api/foo.py")
-    # - must not be immediately preceded by "/" (prevents matching within "https://")
-    # - must be a plausible route with at least one segment after the namespace
-    bare = re.compile(
-        r"(?<![A-Za-z0-9_.-])(?<!/)"
-        r"(?P<path>/(?:api|webhooks|position-statements|cases|client-documents)"
-        r"(?:/[A-Za-z0-9_~{}:-]+)+)"
-    )
-
     def _strip_trailing_punct(p: str) -> str:
         return p.rstrip(").,;:")
 
     def _looks_like_file(p: str) -> bool:
-        return bool(re.search(r"\.(py|ts|tsx|md|json|yml|yaml|txt)$", p, re.IGNORECASE))
+        return p.lower().endswith(_FILE_SUFFIXES)
 
     for line_no, line in _iter_non_code_lines(plan_text):
-        for m in backtick.finditer(line):
+        # Every claim pattern needs a "/", and most plan prose has none.
+        if "/" not in line:
+            continue
+        for m in _BACKTICK_RE.finditer(line):
             path = _strip_trailing_punct(_norm_path(m.group(1)))
             if _looks_like_file(path):
                 continue
@@ -136,7 +211,7 @@ def extract_route_claims(plan_text: str) -> list[RouteClaim]:
                     RouteClaim(path=path, line=line_no, source="backticks", line_text=line.rstrip())
                 )
                 seen.add(key)
-        for m in method_path.finditer(line):
+        for m in _METHOD_PATH_RE.finditer(line):
             path = _strip_trailing_punct(_norm_path(m.group(2)))
             if _looks_like_file(path):
                 continue
@@ -151,7 +226,9 @@ def extract_route_claims(plan_text: str) -> list[RouteClaim]:
                     )
                 )
                 seen.add(key)
-        for m in bare.finditer(line):
+        if not any(token in line for token in _BARE_NAMESPACE_TOKENS):
+            continue
+        for m in _BARE_RE.finditer(line):
             path = _strip_trailing_punct(_norm_path(m.group("path")))
             if _looks_like_file(path):
                 continue
@@ -166,23 +243,17 @@ def extract_route_claims(plan_text: str) -> list[RouteClaim]:
 
 
 def _extract_router_prefix(content: str) -> str:
-    # router = APIRouter(prefix="/api/foo", ...)
     # NOTE: keep simple + deterministic (no AST).
-    m = re.search(r"APIRouter\s*\(\s*[^)]*?\bprefix\s*=\s*['\"]([^'\"]+)['\"]", content, re.DOTALL)
+    m = _ROUTER_PREFIX_RE.search(content)
     if not m:
         return ""
     return _norm_path(m.group(1))
 
 
 def _extract_route_decorators(content: str) -> list[tuple[str, str, int]]:
-    # Matches @router.get("/path") even if the string literal is on the next line.
     # We keep only the first string literal argument.
-    deco = re.compile(
-        r"@\s*router\.(get|post|put|delete|patch|options|head|websocket)\s*\(\s*['\"]([^'\"]+)['\"]",
-        re.IGNORECASE | re.MULTILINE,
-    )
     out: list[tuple[str, str, int]] = []
-    for m in deco.finditer(content):
+    for m in _ROUTE_DECO_RE.finditer(content):
         method = m.group(1).lower()
         path = m.group(2)
         line = content[: m.start()].count("\n") + 1
@@ -193,18 +264,17 @@ def _extract_route_decorators(content: str) -> list[tuple[str, str, int]]:
 def _module_key_for_api_file(api_file: Path, api_root: Path) -> str:
     # backend/api/foo_bar.py -> foo_bar
     # backend/api/sub/mod.py -> sub.mod (best-effort)
-    rel = api_file.relative_to(api_root)
-    return ".".join(rel.with_suffix("").parts)
+    api_file_str = str(api_file)
+    root_prefix = os.path.join(str(api_root), "")
+    if not api_file_str.startswith(root_prefix):
+        rel = api_file.relative_to(api_root)
+        return ".".join(rel.with_suffix("").parts)
+    return ".".join(os.path.splitext(api_file_str[len(root_prefix) :])[0].split(os.sep))
 
 
 def _parse_include_router_mounts(main_py: str) -> dict[str, list[str]]:
     mounts: dict[str, list[str]] = {}
-    # app.include_router(messaging_webhooks.router, prefix="/api", ...)
-    inc = re.compile(
-        r"include_router\s*\(\s*([A-Za-z0-9_\.]+)\s*,\s*(?:[^)]*?\bprefix\s*=\s*['\"]([^'\"]+)['\"])?",
-        re.DOTALL,
-    )
-    for m in inc.finditer(main_py):
+    for m in _INCLUDE_ROUTER_RE.finditer(main_py):
         router_expr = m.group(1)
         prefix = m.group(2) or ""
         prefix = _norm_path(prefix) if prefix else ""
@@ -230,12 +300,8 @@ def _extract_app_route_decorators(content: str) -> list[tuple[str, str, int]]:
     and repos without a `backend/` layout.
     """
     decorators: list[tuple[str, str, int]] = []
-    deco = re.compile(
-        r"@\s*app\.(get|post|put|delete|patch|options|head|websocket)\s*\(\s*['\"]([^'\"]+)['\"]",
-        re.IGNORECASE,
-    )
     for i, line in enumerate(content.splitlines(), start=1):
-        m = deco.search(line)
+        m = _APP_DECO_RE.search(line)
         if not m:
             continue
         decorators.append((m.group(1).upper(), m.group(2), i))
@@ -256,13 +322,17 @@ def _build_route_index_backend_layout(project_root: Path) -> RouteIndex:
 
     routes_by_module: dict[str, list[RouteDef]] = {}
 
-    for py in sorted(api_root.rglob("*.py")):
+    # Scan order doesn't matter: matching only reads final_paths, which RouteIndex sorts.
+    for py in api_root.rglob("*.py"):
         if py.name.startswith("_"):
             continue
         try:
-            content = py.read_text(encoding="utf-8", errors="replace")
+            raw = py.read_bytes()
         except Exception:
             continue
+        if _ROUTER_MARKER_RE.search(raw) is None:
+            continue
+        content = raw.decode("utf-8", errors="replace")
         module_key = _module_key_for_api_file(py, api_root)
         router_prefix = _extract_router_prefix(content)
         decorators = _extract_route_decorators(content)
@@ -307,22 +377,50 @@ def _build_route_index_backend_layout(project_root: Path) -> RouteIndex:
         # don't treat its decorators as live routes.
         if not prefixes:
             continue
+        # Mount prefixes and RouteDef paths are both normalized already; dedupe prefixes so a
+        # module mounted twice under the same prefix doesn't rejoin every route.
+        unique_prefixes = list(dict.fromkeys(prefixes))
         for d in defs:
-            for pref in prefixes:
-                final_paths.add(_join(pref, d.path))
-
-    final_path_regexes: list[tuple[str, re.Pattern[str]]] = []
-    for p in sorted(final_paths):
-        final_path_regexes.append((p, _route_to_regex(p)))
+            for pref in unique_prefixes:
+                final_paths.add(_join_normalized(pref, d.path))
 
     return RouteIndex(
         mounts=mounts,
         routes_by_module=routes_by_module,
         final_paths=final_paths,
-        final_path_regexes=final_path_regexes,
     )
 
 
+def _iter_fallback_py_files(project_root: Path) -> list[tuple[str, ...]]:
+    """
+    Return relative path parts of candidate `*.py` files, in directory-walk order.
+
+    Uses `os.scandir` and prunes excluded directories before descending, instead of
+    letting `rglob` build a Path for every entry under `.venv/`, `node_modules/`, etc.
+    """
+    found: list[tuple[str, ...]] = []
+    stack: list[tuple[str, tuple[str, ...]]] = [(str(project_root), ())]
+    while stack:
+        dir_path, dir_parts = stack.pop()
+        try:
+            entries = list(os.scandir(dir_path))
+        except OSError:
+            continue
+        for entry in entries:
+            name = entry.name
+            if name in _FALLBACK_PRUNED_DIRS:
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                stack.append((entry.path, (*dir_parts, name)))
+            elif name.endswith(".py") and not name.startswith("."):
+                found.append((*dir_parts, name))
+    return found
+
+
 def _build_route_index_fallback(project_root: Path) -> RouteIndex:
     """
     Fallback mode for repos without a `backend/` layout.
@@ -334,39 +432,34 @@ def _build_route_index_fallback(project_root: Path) -> RouteIndex:
     final_paths: set[str] = set()
     routes_by_module: dict[str, list[RouteDef]] = {}
 
-    for py in sorted(project_root.rglob("*.py")):
-        parts = set(py.parts)
-        if "__pycache__" in parts or ".venv" in parts or "venv" in parts:
-            continue
-        if py.name.startswith("."):
-            continue
+    for rel_parts in _iter_fallback_py_files(project_root):
+        rel = os.path.join(*rel_parts)
         try:
-            content = py.read_text(encoding="utf-8", errors="replace")
+            with open(os.path.join(project_root, rel), "rb") as f:
+                raw = f.read()
         except Exception:
             continue
+        if _APP_MARKER_RE.search(raw) is None:
+            continue
+        content = raw.decode("utf-8", errors="replace")
 
         for method, path, line in _extract_app_route_decorators(content):
             norm = _norm_path(path)
             final_paths.add(norm)
-            routes_by_module.setdefault(str(py.relative_to(project_root)), []).append(
+            routes_by_module.setdefault(rel, []).append(
                 RouteDef(
                     method=method,
                     path=norm,
-                    file=str(py.relative_to(project_root)),
+                    file=rel,
                     line=line,
                     router_prefix="",
                 )
             )
 
-    final_path_regexes: list[tuple[str, re.Pattern[str]]] = []
-    for p in sorted(final_paths):
-        final_path_regexes.append((p, _route_to_regex(p)))
-
     return RouteIndex(
         mounts={},
         routes_by_module=routes_by_module,
         final_paths=final_paths,
-        final_path_regexes=final_path_regexes,
     )
 
 
@@ -385,24 +478,25 @@ def match_claim(claim_path: str, idx: RouteIndex) -> str | None:
     # Accept explicit wildcard claims like "/api/foo/*" as "any concrete route below this prefix".
     if claim_path.endswith("/*"):
         base = claim_path[:-2].rstrip("/")
-        prefix = base + "/"
-        for p in idx.final_paths:
-            if p == base or p.startswith(prefix):
-                return p
-        return None
+        if base in idx.final_paths:
+            return base
+        return _first_with_prefix(idx.sorted_paths, base + "/")
     # Accept router-prefix claims like "/api/strategy-tribunal" if any concrete route exists under it.
-    prefix = claim_path.rstrip("/") + "/"
-    for p in idx.final_paths:
-        if p.startswith(prefix):
-            return claim_path
+    if _first_with_prefix(idx.sorted_paths, claim_path.rstrip("/") + "/") is not None:
+        return claim_path
     # Accept uniquely-identifying suffix claims where mount prefix is omitted,
     # e.g. "/results/{analysis_id}" matching "/api/strategy-tribunal/results/{analysis_id}".
-    suffix_matches = [p for p in idx.final_paths if p.endswith(claim_path)]
+    # Claims start with "/", so a suffix match always shares the route's last segment.
+    last_segment = claim_path.rsplit("/", 1)[1]
+    suffix_matches = [
+        p for p in idx.paths_by_last_segment.get(last_segment, ()) if p.endswith(claim_path)
+    ]
     if len(suffix_matches) == 1:
         return suffix_matches[0]
-    for route_path, rx in idx.final_path_regexes:
-        if rx.match(claim_path):
-            return route_path
+    if idx.param_regex is not None:
+        m = idx.param_regex.match(claim_path)
+        if m is not None and m.lastindex is not None:
+            return idx.param_routes[m.lastindex - 1]
     return None
 
 
@@ -417,11 +511,8 @@ def _is_allowed_missing_route_claim(claim: RouteClaim) -> bool:
       - [EXTERNAL] : third-party URL/path
       - [DEAD]     : route string is referenced for cleanup/analysis but is not mounted in the live app
     """
-    text = claim.line_text or ""
-    if any(tag in text for tag in ("[NEW]", "[FRONTEND]", "[EXTERNAL]", "[DEAD]")):
-        return True
-    # Heuristic allow: explicit frontend navigation language.
-    return bool(re.search(r"(?i)\bnavigate\s+to\b", text))
+    # Also heuristically allows explicit frontend navigation language ("navigate to").
+    return _ALLOWED_MISSING_RE.search(claim.line_text or "") is not None
 
 
 def run(
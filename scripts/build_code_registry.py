@@ -16,12 +16,28 @@ from __future__ import annotations
 
 import argparse
 import ast
+import functools
+import hashlib
 import json
+import os
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from _jsonio import dumps_indented
+
+# Below this many files, process-pool startup costs more than parallel parsing saves.
+_PARALLEL_MIN_FILES = 32
+# Bump when the cached per-module fields change shape. The interpreter tag is part
+# of the cache key because ast output differs between Python versions.
+_CACHE_VERSION = "1"
+_CACHE_TAG = f"{_CACHE_VERSION}-{sys.implementation.cache_tag}"
+# Node kinds that are, or directly hold, statements (and so may hold imports).
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
 # ---------------------------------------------------------------------------
 # Project root detection
 # ---------------------------------------------------------------------------
@@ -40,11 +56,15 @@ def _find_project_root() -> Path:
 
 def _module_name_from_path(path: Path, src_dir: Path) -> str:
     """Convert src/foo/bar/baz.py -> foo.bar.baz"""
-    try:
-        rel = path.relative_to(src_dir)
-    except ValueError:
-        rel = path
-    parts = list(rel.parts)
+    path_str = str(path)
+    src_prefix = os.path.join(str(src_dir), "")
+    if path_str.startswith(src_prefix):
+        parts = path_str[len(src_prefix):].split(os.sep)
+    else:
+        try:
+            parts = list(path.relative_to(src_dir).parts)
+        except ValueError:
+            parts = list(path.parts)
     if parts and parts[-1].endswith(".py"):
         parts[-1] = parts[-1][:-3]
     if parts and parts[-1] == "__init__":
@@ -52,18 +72,58 @@ def _module_name_from_path(path: Path, src_dir: Path) -> str:
     return ".".join(parts)
 
 
+def _cache_path(root: Path, digest: str) -> Path:
+    return root / ".cache" / "code_registry" / _CACHE_TAG / digest[:2] / f"{digest[2:]}.json"
+
+
+def _load_cached_info(cache_path: Path) -> dict[str, Any] | None:
+    try:
+        with cache_path.open(encoding="utf-8") as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return info if isinstance(info, dict) else None
+
+
+def _store_cached_info(cache_path: Path, info: dict[str, Any]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(info), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
 def extract_module_info(path: Path, root: Path, src_dir: Path) -> dict[str, Any]:
-    """Parse a Python file with ast and return its catalog entry."""
+    """Parse a Python file with ast and return its catalog entry.
+
+    The path-independent part of the entry is cached under ``.cache/code_registry``
+    keyed by a digest of the source, so unchanged files skip parsing.
+    """
     rel = str(path.relative_to(root))
     module_name = _module_name_from_path(path, src_dir)
 
+    # Hash the raw bytes so cache hits never pay for a decode.
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache_path = _cache_path(root, digest)
+    info = _load_cached_info(cache_path)
+    if info is None:
+        info = _parse_module_source(raw.decode("utf-8", errors="replace"), path)
+        # Parse errors name the file, so only path-independent successes are cached.
+        if "parse_error" not in info:
+            _store_cached_info(cache_path, info)
+    return {"file": rel, "module": module_name, **info}
+
+
+def _parse_module_source(source: str, path: Path) -> dict[str, Any]:
     try:
-        source = path.read_text(errors="replace")
-        tree = ast.parse(source, filename=str(path))
+        # ast.parse() minus the wrapper; dont_inherit keeps this module's __future__
+        # flags out of the compile call.
+        tree = compile(source, str(path), "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
     except SyntaxError as exc:
         return {
-            "file": rel,
-            "module": module_name,
             "parse_error": str(exc),
             "classes": [],
             "functions": [],
@@ -106,20 +166,28 @@ def extract_module_info(path: Path, root: Path, src_dir: Path) -> dict[str, Any]
                 }
             )
 
-    # Collect all imports (for dependency graph)
-    for node in ast.walk(tree):
+    # Collect all imports (for dependency graph), including function-local lazy imports.
+    # Imports are statements, so only statement-bearing nodes are descended into;
+    # expression subtrees (the bulk of any AST) are never visited.
+    stack: list[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
         if isinstance(node, ast.Import):
             for alias in node.names:
                 imports.append(alias.name)
         elif isinstance(node, ast.ImportFrom):
             if node.module:
                 imports.append(node.module)
+        else:
+            stack.extend(
+                child
+                for child in ast.iter_child_nodes(node)
+                if isinstance(child, _STATEMENT_CONTAINERS)
+            )
 
     source_lines = source.count("\n") + 1
 
     return {
-        "file": rel,
-        "module": module_name,
         "classes": classes,
         "functions": functions,
         "imports": sorted(set(imports)),
@@ -131,6 +199,13 @@ def extract_module_info(path: Path, root: Path, src_dir: Path) -> dict[str, Any]
 # Catalog builder
 # ---------------------------------------------------------------------------
 
+def _collect_modules(modules: list[dict[str, Any]], results: Iterable[dict[str, Any]]) -> None:
+    # executor.map preserves input order, so the catalog stays sorted by path.
+    for info in results:
+        modules.append(info)
+        print(f"  indexed: {info['file']}", file=sys.stderr)
+
+
 def build_catalog(root: Path) -> dict[str, Any]:
     src_dir = root / "src"
     if not src_dir.is_dir():
@@ -139,10 +214,12 @@ def build_catalog(root: Path) -> dict[str, Any]:
     py_files = sorted(src_dir.rglob("*.py")) if src_dir.is_dir() else []
     modules: list[dict[str, Any]] = []
 
-    for path in py_files:
-        info = extract_module_info(path, root, src_dir)
-        modules.append(info)
-        print(f"  indexed: {info['file']}", file=sys.stderr)
+    extract = functools.partial(extract_module_info, root=root, src_dir=src_dir)
+    if len(py_files) < _PARALLEL_MIN_FILES:
+        _collect_modules(modules, map(extract, py_files))
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            _collect_modules(modules, executor.map(extract, py_files, chunksize=8))
 
     total_lines = sum(m.get("lines", 0) for m in modules)
     total_classes = sum(len(m.get("classes", [])) for m in modules)
@@ -160,6 +237,10 @@ def build_catalog(root: Path) -> dict[str, Any]:
     }
 
 
+def _write_catalog(catalog: dict[str, Any], out_path: Path) -> None:
+    out_path.write_bytes(dumps_indented(catalog))
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -194,7 +275,7 @@ def main() -> None:
     catalog = build_catalog(root)
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(catalog, indent=2))
+    _write_catalog(catalog, out_path)
 
     print(
         f"[build_code_registry] Wrote catalog: "
@@ -16,11 +16,39 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import codecs
+import fnmatch
+import functools
 import json
+import locale
+import os
 import re
 import sys
-from pathlib import Path
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePath
+from typing import Any, NamedTuple
+
+from _jsonio import json_loads, print_json
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+# Patterns that may not be merged into a shared alternation: group renumbering would
+# break numeric backreferences and conditionals, and named ones could collide.
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+_DEFAULT_REGEX_FLAGS = re.compile("").flags
+# read_text() decodes with the locale encoding; raw-byte needle search is only
+# equivalent to searching the decoded text when that encoding is UTF-8.
+_TEXT_ENCODING = locale.getpreferredencoding(False)
+_LOCALE_IS_UTF8 = codecs.lookup(_TEXT_ENCODING).name == "utf-8"
+# Below this many files, process-pool startup costs more than parallel scanning saves.
+_PARALLEL_MIN_FILES = 32
 
 # ---------------------------------------------------------------------------
 # Project root detection
@@ -54,7 +82,7 @@ def load_patterns(root: Path) -> list[dict[str, Any]]:
         _err(f"WARNING: patterns.json not found at {patterns_file} — no patterns to check.")
         return []
     try:
-        data = json.loads(patterns_file.read_text())
+        data = json_loads(patterns_file.read_text())
     except json.JSONDecodeError as exc:
         _err(f"ERROR: Failed to parse patterns.json: {exc}")
         return []
@@ -78,11 +106,108 @@ def load_patterns(root: Path) -> list[dict[str, Any]]:
 # File globbing
 # ---------------------------------------------------------------------------
 
+@functools.cache
+def _walk_tree(base: str, max_depth: int | None) -> tuple[list[tuple[str, ...]], bool]:
+    """Return entries below base as relative path parts, walking the tree once.
+
+    Only entries at most ``max_depth`` levels deep are listed (no limit when None),
+    so patterns without ``**`` never descend further than they can match.
+
+    The flag is True if a symlinked directory would be descended into; ``Path.glob``
+    treats those differently for ``*`` and ``**``, so callers fall back to it then.
+    """
+    entries: list[tuple[str, ...]] = []
+    stack: list[tuple[str, tuple[str, ...]]] = [(base, ())]
+    while stack:
+        dir_path, dir_parts = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                listing = list(it)
+        except OSError:
+            continue
+        for entry in listing:
+            parts = (*dir_parts, entry.name)
+            entries.append(parts)
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir and (max_depth is None or len(parts) < max_depth):
+                if entry.is_symlink():
+                    return entries, True
+                stack.append((entry.path, parts))
+    return entries, False
+
+
+def _match_parts(
+    parts: tuple[str, ...], matchers: list[Callable[[str], Any] | None], i: int, j: int
+) -> bool:
+    # None stands for "**": zero or more directories (never the final entry itself).
+    while j < len(matchers):
+        matcher = matchers[j]
+        if matcher is None:
+            return any(_match_parts(parts, matchers, k, j + 1) for k in range(i, len(parts)))
+        if i >= len(parts) or not matcher(parts[i]):
+            return False
+        i += 1
+        j += 1
+    return i == len(parts)
+
+
+@functools.cache
+def _component_matcher(part: str) -> Callable[[str], Any]:
+    """Compile one glob path component; patterns share components like ``*.py``."""
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(fnmatch.translate(part), flags).fullmatch
+
+
+def _glob_cached(root: Path, pattern: str) -> list[Path] | None:
+    """Resolve a relative glob against a cached walk, or None if Path.glob must handle it."""
+    parts = PurePath(pattern).parts
+    if not parts or PurePath(pattern).anchor or parts[-1] == "**" or ".." in parts:
+        return None
+    if any("**" in part and part != "**" for part in parts):
+        return None
+    literal: list[str] = []
+    for part in parts:
+        if part == "**" or any(ch in part for ch in "*?["):
+            break
+        literal.append(part)
+    rest = parts[len(literal) :]
+    if not rest:
+        return None
+    base = root.joinpath(*literal)
+    max_depth = None if "**" in rest else len(rest)
+    entries, saw_symlinked_dir = _walk_tree(str(base), max_depth)
+    if saw_symlinked_dir:
+        return None
+    matchers: list[Callable[[str], Any] | None] = [
+        None if part == "**" else _component_matcher(part) for part in rest
+    ]
+    return [base.joinpath(*e) for e in entries if _match_parts(e, matchers, 0, 0)]
+
+
+@functools.cache
+def _glob(root: Path, pattern: str) -> tuple[Path, ...]:
+    """Paths matching one glob, resolved once per run however many patterns use it."""
+    matched = _glob_cached(root, pattern)
+    return tuple(root.glob(pattern) if matched is None else matched)
+
+
 def _expand_globs(root: Path, globs: list[str]) -> list[Path]:
-    result: list[Path] = []
+    """Deduplicated matches of all globs, unsorted; ``_scan_files`` orders the results."""
+    result: dict[Path, None] = {}
     for g in globs:
-        result.extend(root.glob(g))
-    return sorted(set(result))
+        result.update(dict.fromkeys(_glob(root, g)))
+    return list(result)
+
+
+def _map_files(func: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+    """Apply func to every per-file item, in order; large sets go through a process pool."""
+    if len(items) < _PARALLEL_MIN_FILES:
+        return [func(item) for item in items]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(func, items, chunksize=32))
 
 
 # ---------------------------------------------------------------------------
@@ -110,6 +235,296 @@ def _make_finding(
     }
 
 
+def _can_combine(regex: str, compiled: re.Pattern[str]) -> bool:
+    return compiled.flags == _DEFAULT_REGEX_FLAGS and _BACKREF_RE.search(regex) is None
+
+
+def _is_context_free(regex: str) -> bool:
+    """True if a match can't depend on text outside the matched span.
+
+    Such a regex hits some line iff it hits the whole file, so a single search over
+    the file text can rule it out for every line. Anchors, word boundaries and
+    lookarounds look past the match (and past line breaks), so they disqualify.
+    """
+    i = 0
+    n = len(regex)
+    while i < n:
+        c = regex[i]
+        if c == "\\":
+            if regex[i + 1 : i + 2] in ("b", "B", "A", "Z"):
+                return False
+            i += 2
+        elif c == "[":
+            # Skip the class; a leading "^" negates and a leading "]" is literal.
+            i += 1
+            if regex[i : i + 1] == "^":
+                i += 1
+            if regex[i : i + 1] == "]":
+                i += 1
+            while i < n and regex[i] != "]":
+                i += 2 if regex[i] == "\\" else 1
+            i += 1
+        elif c in "^$" or regex.startswith(("(?=", "(?!", "(?<=", "(?<!"), i):
+            return False
+        else:
+            i += 1
+    return True
+
+
+def _combine(
+    checks: list[tuple[dict[str, Any], str]],
+    members: list[tuple[int, dict[str, Any], re.Pattern[str]]],
+) -> re.Pattern[str] | None:
+    try:
+        return re.compile("|".join(f"(?:{checks[i][1]})" for i, _, _ in members))
+    except re.error:
+        return None
+
+
+class _GrepPlan(NamedTuple):
+    """Compiled form of a group of grep checks; members are (check index, regex)."""
+
+    free_combined: re.Pattern[str] | None
+    free: list[tuple[int, re.Pattern[str]]]
+    bound_combined: re.Pattern[str] | None
+    bound: list[tuple[int, re.Pattern[str]]]
+    solo: list[tuple[int, re.Pattern[str]]]
+
+
+def _compile_grep_plan(checks: list[tuple[dict[str, Any], str]]) -> _GrepPlan:
+    """Compile (pattern, regex) checks, reporting invalid regexes.
+
+    Mergeable regexes are OR-ed into prefilters: context-free ones are searched over
+    the whole file text first (a miss skips them for every line), the rest per line.
+    Only lines a prefilter hits are re-checked against each member, so findings are
+    identical to running every check on its own.
+    """
+    members: list[tuple[int, dict[str, Any], re.Pattern[str]]] = []
+    for i, (pattern, regex) in enumerate(checks):
+        try:
+            members.append((i, pattern, re.compile(regex)))
+        except re.error as exc:
+            _err(f"ERROR: Pattern {pattern['id']}: invalid regex '{regex}': {exc}")
+
+    mergeable = [m for m in members if _can_combine(checks[m[0]][1], m[2])]
+    free = [m for m in mergeable if _is_context_free(checks[m[0]][1])]
+    free_combined = _combine(checks, free) if free else None
+    if free_combined is None:
+        free = []
+    free_ids = {i for i, _, _ in free}
+    bound = [m for m in mergeable if m[0] not in free_ids]
+    bound_combined = _combine(checks, bound) if len(bound) > 1 else None
+    if bound_combined is None:
+        bound = []
+    merged_ids = free_ids | {i for i, _, _ in bound}
+    return _GrepPlan(
+        free_combined=free_combined,
+        free=[(i, compiled) for i, _, compiled in free],
+        bound_combined=bound_combined,
+        bound=[(i, compiled) for i, _, compiled in bound],
+        solo=[(i, compiled) for i, _, compiled in members if i not in merged_ids],
+    )
+
+
+def _grep_text(text: str, plan: _GrepPlan) -> list[tuple[int, int, str]]:
+    """Return (check index, line number, line) for every line a check matches."""
+    hits: list[tuple[int, int, str]] = []
+    free_combined = plan.free_combined
+    free_hit = free_combined is not None and free_combined.search(text) is not None
+    if not free_hit and not plan.bound and not plan.solo:
+        return hits
+    # This loop runs once per line of every scanned file, so plan fields and bound
+    # methods are looked up once here rather than on each line.
+    free_search = free_combined.search if free_hit else None
+    bound_search = plan.bound_combined.search if plan.bound_combined is not None else None
+    free, bound, solo = plan.free, plan.bound, plan.solo
+    extend = hits.extend
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if free_search is not None and free_search(line):
+            extend((i, lineno, line) for i, rx in free if rx.search(line))
+        if bound_search is not None and bound_search(line):
+            extend((i, lineno, line) for i, rx in bound if rx.search(line))
+        if solo:
+            extend((i, lineno, line) for i, rx in solo if rx.search(line))
+    return hits
+
+
+def _raw_needle(needle: str) -> bytes | None:
+    """UTF-8 bytes to look for in undecoded file content, or None if that isn't exact.
+
+    Decoding turns bad bytes into U+FFFD, so needles containing it have to be searched
+    for in decoded text. Line breaks are only exact on files without a carriage
+    return; ``_scan_file`` checks that per file.
+    """
+    if not _LOCALE_IS_UTF8 or "\ufffd" in needle:
+        return None
+    try:
+        return needle.encode("utf-8")
+    except UnicodeEncodeError:
+        return None
+
+
+def _build_needle_automaton(raw_needles: list[bytes | None]) -> Any:
+    """Aho-Corasick automaton over the byte needles, or None if it wouldn't pay off.
+
+    Keys are the needles' bytes decoded as latin-1, so matching them against a
+    latin-1 decode of the file is exactly a byte-level search; values are the keys
+    themselves, which keeps needles shared by several patterns distinct from indices.
+    """
+    keys = {raw.decode("latin-1") for raw in raw_needles if raw}
+    if not AHOCORASICK_AVAILABLE or len(keys) < 2:
+        return None
+    automaton = ahocorasick.Automaton()
+    for key in keys:
+        automaton.add_word(key, key)
+    automaton.make_automaton()
+    return automaton
+
+
+def _spans_lines(raw_needle: bytes) -> bool:
+    return b"\n" in raw_needle or b"\r" in raw_needle
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode file bytes the way ``Path.read_text(errors="replace")`` would."""
+    text = raw.decode(_TEXT_ENCODING, errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _scan_file(
+    task: tuple[Path, tuple[int, ...], tuple[int, ...]],
+    plans: list[_GrepPlan],
+    needles: list[tuple[str, bytes | None]],
+    automaton: Any,
+) -> tuple[list[list[tuple[int, int, str]]], list[bool], str | None]:
+    """Run every grep group and absent check that covers one file on a single read."""
+    path, group_ids, needle_ids = task
+    try:
+        with path.open("rb") as f:
+            raw = f.read()
+    except OSError as exc:
+        return [], [], f"WARNING: Cannot read {path}: {exc}"
+
+    byte_needles = {a: raw_n for a in needle_ids if (raw_n := needles[a][1]) is not None}
+    # Text reads turn "\r\n" and "\r" into "\n", so needles spanning lines only match
+    # the raw bytes of files that contain no carriage return.
+    if any(map(_spans_lines, byte_needles.values())) and b"\r" in raw:
+        byte_needles = {a: n for a, n in byte_needles.items() if not _spans_lines(n)}
+
+    # With several byte needles on this file, one automaton pass finds them all.
+    seen: set[str] | None = None
+    wanted = {n.decode("latin-1") for n in byte_needles.values() if n}
+    if automaton is not None and len(wanted) > 1:
+        seen = set()
+        for _, key in automaton.iter(raw.decode("latin-1")):
+            if key in wanted:
+                seen.add(key)
+                if len(seen) == len(wanted):
+                    break
+
+    text: str | None = None
+    found: list[bool] = []
+    for a in needle_ids:
+        raw_needle = byte_needles.get(a)
+        if raw_needle is not None:
+            if seen is not None and raw_needle:
+                found.append(raw_needle.decode("latin-1") in seen)
+            else:
+                found.append(raw_needle in raw)
+            continue
+        if text is None:
+            text = _decode_text(raw)
+        found.append(needles[a][0] in text)
+    if group_ids and text is None:
+        text = _decode_text(raw)
+    return [_grep_text(text, plans[g]) for g in group_ids], found, None
+
+
+def _scan_files(
+    grep_jobs: list[tuple[_GrepPlan, list[Path]]],
+    absent_jobs: list[tuple[str, list[Path]]],
+) -> tuple[list[dict[Path, list[tuple[int, int, str]]]], list[dict[Path, bool]]]:
+    """Read each file needed by any job once and run all of that file's checks on it.
+
+    Returns per-job results keyed by path, in sorted path order; unreadable files are
+    reported once and left out.
+    """
+    tasks: dict[Path, tuple[list[int], list[int]]] = {}
+    for g, (_, paths) in enumerate(grep_jobs):
+        for path in paths:
+            tasks.setdefault(path, ([], []))[0].append(g)
+    for a, (_, paths) in enumerate(absent_jobs):
+        for path in paths:
+            tasks.setdefault(path, ([], []))[1].append(a)
+    items = [(path, tuple(tasks[path][0]), tuple(tasks[path][1])) for path in sorted(tasks)]
+
+    needles = [(needle, _raw_needle(needle)) for needle, _ in absent_jobs]
+    scan = functools.partial(
+        _scan_file,
+        plans=[plan for plan, _ in grep_jobs],
+        needles=needles,
+        automaton=_build_needle_automaton([raw for _, raw in needles]),
+    )
+    grep_hits: list[dict[Path, list[tuple[int, int, str]]]] = [{} for _ in grep_jobs]
+    absent_found: list[dict[Path, bool]] = [{} for _ in absent_jobs]
+    for (path, group_ids, needle_ids), (hits, found, warning) in zip(
+        items, _map_files(scan, items), strict=True
+    ):
+        if warning is not None:
+            _err(warning)
+            continue
+        for g, group_hits in zip(group_ids, hits, strict=True):
+            grep_hits[g][path] = group_hits
+        for a, present in zip(needle_ids, found, strict=True):
+            absent_found[a][path] = present
+    return grep_hits, absent_found
+
+
+def _grep_paths(root: Path, file_globs: list[str], exclude_globs: list[str]) -> list[Path]:
+    exclude_paths: set[Path] = set()
+    for eg in exclude_globs:
+        exclude_paths.update(_glob(root, eg))
+    return [
+        path
+        for path in _expand_globs(root, file_globs)
+        if path.is_file() and path not in exclude_paths
+    ]
+
+
+def _grep_findings(
+    root: Path,
+    checks: list[tuple[dict[str, Any], str]],
+    hits_by_path: dict[Path, list[tuple[int, int, str]]],
+) -> list[list[dict[str, Any]]]:
+    results: list[list[dict[str, Any]]] = [[] for _ in checks]
+    for path, hits in hits_by_path.items():
+        if not hits:
+            continue
+        rel = str(path.relative_to(root))
+        for i, lineno, line in hits:
+            results[i].append(_make_finding(checks[i][0], rel, lineno, line))
+    return results
+
+
+def check_grep_group(
+    root: Path,
+    checks: list[tuple[dict[str, Any], str]],
+    file_globs: list[str],
+    exclude_globs: list[str],
+) -> list[list[dict[str, Any]]]:
+    """Run several (pattern, regex) grep checks sharing the same globs in one pass.
+
+    Each file is read and split once. Returns one findings list per check, in
+    input order.
+    """
+    plan = _compile_grep_plan(checks)
+    paths = _grep_paths(root, file_globs, exclude_globs)
+    (hits_by_path,), _ = _scan_files([(plan, paths)], [])
+    return _grep_findings(root, checks, hits_by_path)
+
+
 def check_grep(
     root: Path,
     pattern: dict[str, Any],
@@ -118,33 +533,43 @@ def check_grep(
     exclude_globs: list[str],
 ) -> list[dict[str, Any]]:
     """Search for regex matches across files; each match becomes a finding."""
-    findings: list[dict[str, Any]] = []
+    return check_grep_group(root, [(pattern, regex)], file_globs, exclude_globs)[0]
 
-    exclude_paths: set[Path] = set()
-    for eg in exclude_globs:
-        exclude_paths.update(root.glob(eg))
 
-    try:
-        compiled = re.compile(regex)
-    except re.error as exc:
-        _err(f"ERROR: Pattern {pattern['id']}: invalid regex '{regex}': {exc}")
-        return []
-
-    for path in _expand_globs(root, file_globs):
-        if not path.is_file():
-            continue
-        if path in exclude_paths:
-            continue
-        try:
-            lines = path.read_text(errors="replace").splitlines()
-        except OSError as exc:
-            _err(f"WARNING: Cannot read {path}: {exc}")
+def _absent_no_match_findings(
+    pattern: dict[str, Any], needle: str, file_globs: list[str]
+) -> list[dict[str, Any]]:
+    # No files matched the glob — the file itself is missing
+    return [
+        _make_finding(
+            pattern,
+            g,
+            None,
+            f"No files matched glob '{g}' — cannot verify presence of '{needle}'",
+        )
+        for g in file_globs
+    ]
+
+
+def _absent_findings(
+    root: Path,
+    pattern: dict[str, Any],
+    needle: str,
+    found_by_path: dict[Path, bool],
+) -> list[dict[str, Any]]:
+    findings: list[dict[str, Any]] = []
+    for path, found in found_by_path.items():
+        if found:
             continue
-        for lineno, line in enumerate(lines, 1):
-            if compiled.search(line):
-                rel = str(path.relative_to(root))
-                findings.append(_make_finding(pattern, rel, lineno, line))
-
+        rel = str(path.relative_to(root))
+        findings.append(
+            _make_finding(
+                pattern,
+                rel,
+                None,
+                f"Required token '{needle}' not found in file.",
+            )
+        )
     return findings
 
 
@@ -155,63 +580,87 @@ def check_absent(
     file_globs: list[str],
 ) -> list[dict[str, Any]]:
     """Check that needle IS present in each matched file; report if absent."""
-    findings: list[dict[str, Any]] = []
     matched_files = _expand_globs(root, file_globs)
-
     if not matched_files:
-        # No files matched the glob — the file itself is missing
-        for g in file_globs:
-            findings.append(
-                _make_finding(
-                    pattern,
-                    g,
-                    None,
-                    f"No files matched glob '{g}' — cannot verify presence of '{needle}'",
-                )
-            )
-        return findings
+        return _absent_no_match_findings(pattern, needle, file_globs)
 
-    for path in matched_files:
-        if not path.is_file():
-            continue
-        try:
-            content = path.read_text(errors="replace")
-        except OSError as exc:
-            _err(f"WARNING: Cannot read {path}: {exc}")
-            continue
-        if needle not in content:
-            rel = str(path.relative_to(root))
-            findings.append(
-                _make_finding(
-                    pattern,
-                    rel,
-                    None,
-                    f"Required token '{needle}' not found in file.",
-                )
-            )
-    return findings
+    paths = [path for path in matched_files if path.is_file()]
+    _, (found_by_path,) = _scan_files([], [(needle, paths)])
+    return _absent_findings(root, pattern, needle, found_by_path)
 
 
 # ---------------------------------------------------------------------------
 # Main check dispatcher
 # ---------------------------------------------------------------------------
 
+def _pattern_globs(pat: dict[str, Any], key: str) -> list[str]:
+    globs: list[str] = pat.get(key, [])
+    if isinstance(globs, str):
+        globs = [globs]
+    return globs
+
+
 def run_checks(root: Path, patterns: list[dict[str, Any]]) -> list[dict[str, Any]]:
     all_findings: list[dict[str, Any]] = []
+    # Directory walks and glob results are shared by every pattern in this run, but
+    # never across runs.
+    _walk_tree.cache_clear()
+    _glob.cache_clear()
+
+    # Grep patterns with the same file/exclude globs are planned as one group, and
+    # every file is read once for all groups and absent checks that cover it.
+    grep_groups: dict[tuple[tuple[str, ...], tuple[str, ...]], list[int]] = {}
+    for n, pat in enumerate(patterns):
+        if pat.get("check_type", "grep") == "grep":
+            key = (
+                tuple(sorted(_pattern_globs(pat, "files"))),
+                tuple(sorted(_pattern_globs(pat, "exclude"))),
+            )
+            grep_groups.setdefault(key, []).append(n)
+    grep_jobs: list[tuple[_GrepPlan, list[Path]]] = []
+    grep_checks: list[list[tuple[dict[str, Any], str]]] = []
+    for (file_globs, exclude_globs), indices in grep_groups.items():
+        checks = [(patterns[n], patterns[n]["pattern"]) for n in indices]
+        grep_checks.append(checks)
+        grep_jobs.append(
+            (_compile_grep_plan(checks), _grep_paths(root, list(file_globs), list(exclude_globs)))
+        )
+
+    absent_jobs: list[tuple[str, list[Path]]] = []
+    absent_job_of: dict[int, int] = {}
+    absent_no_match: dict[int, list[dict[str, Any]]] = {}
+    for n, pat in enumerate(patterns):
+        if pat.get("check_type", "grep") != "absent":
+            continue
+        file_globs = _pattern_globs(pat, "files")
+        matched_files = _expand_globs(root, file_globs)
+        if not matched_files:
+            absent_no_match[n] = _absent_no_match_findings(pat, pat["pattern"], file_globs)
+            continue
+        absent_job_of[n] = len(absent_jobs)
+        absent_jobs.append((pat["pattern"], [path for path in matched_files if path.is_file()]))
+
+    grep_hits, absent_found = _scan_files(grep_jobs, absent_jobs)
+
+    grep_findings: dict[int, list[dict[str, Any]]] = {}
+    for (_, indices), checks, hits_by_path in zip(
+        grep_groups.items(), grep_checks, grep_hits, strict=True
+    ):
+        group_findings = _grep_findings(root, checks, hits_by_path)
+        grep_findings.update(zip(indices, group_findings, strict=True))
 
-    for pat in patterns:
+    for n, pat in enumerate(patterns):
         check_type = pat.get("check_type", "grep")
-        file_globs: list[str] = pat.get("files", [])
-        if isinstance(file_globs, str):
-            file_globs = [file_globs]
-        exclude_globs: list[str] = pat.get("exclude", [])
-        if isinstance(exclude_globs, str):
-            exclude_globs = [exclude_globs]
 
         if check_type == "grep":
-            findings = check_grep(root, pat, pat["pattern"], file_globs, exclude_globs)
+            findings = grep_findings[n]
         elif check_type == "absent":
-            findings = check_absent(root, pat, pat["pattern"], file_globs)
+            if n in absent_no_match:
+                findings = absent_no_match[n]
+            else:
+                a = absent_job_of[n]
+                needle = absent_jobs[a][0]
+                findings = _absent_findings(root, pat, needle, absent_found[a])
         else:
             _err(f"WARNING: Unknown check_type '{check_type}' for pattern {pat.get('id')} — skipping.")
             findings = []
@@ -257,14 +706,14 @@ def main() -> None:
     patterns = load_patterns(root)
     if not patterns:
         # No patterns configured — emit empty findings array and exit clean
-        print(json.dumps([], indent=2))
+        print_json([])
         sys.exit(0)
 
     findings = run_checks(root, patterns)
     _err(f"Total findings: {len(findings)}")
 
     # Emit PURE JSON to stdout — this is the only stdout output
-    print(json.dumps(findings, indent=2))
+    print_json(findings)
     sys.exit(1 if findings else 0)
 
 
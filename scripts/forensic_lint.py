@@ -18,27 +18,66 @@ Exit codes:
     2 = warnings only
 """
 
-import json
 import re
 import sys
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from _jsonio import json_loads
 
-def load_evidence(evidence_path: Path) -> list[dict[str, Any]]:
-    entries: list[dict[str, Any]] = []
+_HEX_RE = re.compile(r"^[a-f0-9]+$")
+_HEADER_TRANS = str.maketrans({" ": "_", "-": "_"})
+
+
+@dataclass(frozen=True)
+class EvidenceViews:
+    """What the checks need from evidence.jsonl, gathered in one pass."""
+
+    count: int
+    ids: set[str]
+    # Latest (last-written) entry per receipt ID.
+    latest: dict[str, dict[str, Any]]
+    # Exit codes per command, in file order.
+    gate_results: dict[str, list[int | None]]
+
+
+def load_evidence_views(evidence_path: Path) -> EvidenceViews:
+    count = 0
+    ids: set[str] = set()
+    latest: dict[str, dict[str, Any]] = {}
+    gate_results: dict[str, list[int | None]] = defaultdict(list)
     with open(evidence_path) as f:
         for line in f:
             line = line.strip()
-            if line:
-                entries.append(json.loads(line))
-    return entries
+            if not line:
+                continue
+            entry = json_loads(line)
+            count += 1
+            eid = entry["id"]
+            ids.add(eid)
+            latest[eid] = entry  # later entries overwrite earlier
+            gate_results[entry.get("cmd", "")].append(entry.get("rc"))
+    return EvidenceViews(count, ids, latest, gate_results)
 
 
 def extract_plan_receipt_rows(plan_path: Path) -> list[dict[str, Any]]:
     """Extract receipt rows from the plan's markdown table."""
-    lines = plan_path.read_text().splitlines()
+    # Streamed, so reading stops at the end of the receipts table.
+    with plan_path.open() as f:
+        return _parse_receipt_rows(_iter_plan_lines(f))
+
+
+def _iter_plan_lines(f: Iterable[str]) -> Iterator[str]:
+    # File iteration only breaks on "\n"; splitlines() keeps the str.splitlines()
+    # boundaries (form feed, U+2028, ...) the plan parser has always used.
+    for chunk in f:
+        yield from chunk.splitlines()
+
+
+def _parse_receipt_rows(lines: Iterable[str]) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
     in_receipt_table = False
     headers: list[str] = []
@@ -55,7 +94,7 @@ def extract_plan_receipt_rows(plan_path: Path) -> list[dict[str, Any]]:
             if stripped.startswith("|") and "---" not in stripped:
                 cells = [c.strip().strip("`") for c in stripped.split("|")[1:-1]]
                 if not headers:
-                    headers = [h.lower().replace(" ", "_").replace("-", "_") for h in cells]
+                    headers = [h.lower().translate(_HEADER_TRANS) for h in cells]
                 else:
                     if len(cells) >= len(headers):
                         row = dict(zip(headers, cells, strict=False))
@@ -77,12 +116,10 @@ def extract_plan_status(plan_path: Path) -> str:
     return "UNKNOWN"
 
 
-def check_id_concordance(
-    plan_rows: list[dict[str, Any]], evidence: list[dict[str, Any]]
-) -> list[str]:
+def check_id_concordance(plan_rows: list[dict[str, Any]], evidence: EvidenceViews) -> list[str]:
     """R50/RULE 91: Plan receipt IDs must match evidence.jsonl IDs."""
     failures: list[str] = []
-    evidence_ids = {e["id"] for e in evidence}
+    evidence_ids = evidence.ids
 
     for row in plan_rows:
         rid = row.get("id", "")
@@ -113,17 +150,24 @@ def check_row_atomic(plan_rows: list[dict[str, Any]]) -> list[str]:
     # Hash fields may have varying header names
     hash_patterns = ["stdout", "stderr", "sha"]
 
+    # Rows of one receipts table share a header set, so the field checks only
+    # rerun when a row's keys differ from the previous row's.
+    last_keys: Any = None
+    missing: set[str] = set()
+    has_hash = True
     for row in plan_rows:
-        keys = set(row.keys())
-        missing = required - keys
+        keys = row.keys()
+        if keys != last_keys:
+            last_keys = keys
+            missing = required - set(keys)
+            # Check for hash fields
+            has_hash = any(any(p in k for p in hash_patterns) for k in keys)
+
         if missing:
             failures.append(
                 f"HARD-FAIL [R39]: Receipt '{row.get('id', '?')}' missing "
                 f"row-atomic fields: {missing}"
             )
-
-        # Check for hash fields
-        has_hash = any(any(p in k for p in hash_patterns) for k in keys)
         if not has_hash:
             failures.append(
                 f"HARD-FAIL [R44]: Receipt '{row.get('id', '?')}' missing hash columns."
@@ -134,13 +178,19 @@ def check_row_atomic(plan_rows: list[dict[str, Any]]) -> list[str]:
 def check_hash_length(plan_rows: list[dict[str, Any]]) -> list[str]:
     """R44/RULE 85: All SHA-256 hashes must be exactly 64 hex chars."""
     failures: list[str] = []
-    sha_pattern = re.compile(r"^[a-f0-9]+$")
+    # Rows normally share one header set, so classify each column name once.
+    is_hash_key: dict[str, bool] = {}
 
     for row in plan_rows:
         for key, value in row.items():
-            if "sha" in key.lower() or "hash" in key.lower():
+            hash_key = is_hash_key.get(key)
+            if hash_key is None:
+                lowered = key.lower()
+                hash_key = is_hash_key[key] = "sha" in lowered or "hash" in lowered
+            if hash_key:
                 val = value.strip().strip("`")
-                if val and val != "_pending_" and sha_pattern.match(val) and len(val) != 64:
+                # Full-length values pass whatever they contain; only test shorter/longer ones.
+                if val and len(val) != 64 and val != "_pending_" and _HEX_RE.match(val):
                     failures.append(
                         f"HARD-FAIL [R44]: Receipt '{row.get('id', '?')}' "
                         f"field '{key}' has truncated hash ({len(val)} chars, "
@@ -149,21 +199,14 @@ def check_hash_length(plan_rows: list[dict[str, Any]]) -> list[str]:
     return failures
 
 
-def check_mixed_exit_stability(evidence: list[dict[str, Any]]) -> list[str]:
+def check_mixed_exit_stability(evidence: EvidenceViews) -> list[str]:
     """R46/RULE 87: Gates with mixed rc need 3-pass stability proof."""
     failures: list[str] = []
-    gate_results: dict[str, list[int | None]] = defaultdict(list)
-
-    for entry in evidence:
-        # Group by base command (normalize)
-        cmd = entry.get("cmd", "")
-        rc = entry.get("rc")
-        gate_results[cmd].append(rc)
 
-    for cmd, rcs in gate_results.items():
+    for cmd, rcs in evidence.gate_results.items():
         if len(set(rcs)) > 1:
             # Mixed exit codes — need at least 3 consecutive passes
-            pass_count = sum(1 for r in rcs if r == 0)
+            pass_count = rcs.count(0)
             if pass_count < 3:
                 failures.append(
                     f"HARD-FAIL [R46]: Gate '{cmd[:60]}...' has mixed exit "
@@ -172,12 +215,10 @@ def check_mixed_exit_stability(evidence: list[dict[str, Any]]) -> list[str]:
     return failures
 
 
-def check_command_parity(
-    plan_rows: list[dict[str, Any]], evidence: list[dict[str, Any]]
-) -> list[str]:
+def check_command_parity(plan_rows: list[dict[str, Any]], evidence: EvidenceViews) -> list[str]:
     """R37/RULE 82: Plan gate command must match evidence command."""
     failures: list[str] = []
-    evidence_by_id = {e["id"]: e for e in evidence}
+    evidence_by_id = evidence.latest
 
     for row in plan_rows:
         rid = row.get("id", "")
@@ -194,18 +235,15 @@ def check_command_parity(
 
 
 def check_go_consistency(
-    plan_status: str, evidence: list[dict[str, Any]], plan_rows: list[dict[str, Any]]
+    plan_status: str, evidence: EvidenceViews, plan_rows: list[dict[str, Any]]
 ) -> list[str]:
     """R40/RULE 81: If any mandatory gate has rc≠0 latest, can't be GO."""
     failures: list[str] = []
     if plan_status != "GO":
         return failures
 
-    # Get latest evidence entry per ID
-    latest: dict[str, dict[str, Any]] = {}
-    for entry in evidence:
-        eid = entry["id"]
-        latest[eid] = entry  # later entries overwrite earlier
+    # Latest evidence entry per ID
+    latest = evidence.latest
 
     # Check plan receipt IDs
     for row in plan_rows:
@@ -234,7 +272,7 @@ def main() -> None:
         print("ERROR: evidence.jsonl not found")
         sys.exit(2)
 
-    evidence = load_evidence(evidence_path)
+    evidence = load_evidence_views(evidence_path)
     plan_rows = extract_plan_receipt_rows(plan_path)
     plan_status = extract_plan_status(plan_path)
 
@@ -242,7 +280,7 @@ def main() -> None:
     print(f"  Plan: {plan_path}")
     print(f"  Status: {plan_status}")
     print(f"  Receipt rows: {len(plan_rows)}")
-    print(f"  Evidence entries: {len(evidence)}")
+    print(f"  Evidence entries: {evidence.count}")
     print()
 
     all_failures: list[str] = []
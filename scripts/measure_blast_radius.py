@@ -15,6 +15,7 @@ Usage:
 
 Prerequisites:
     data/code_catalog.json must exist (run scripts/build_code_registry.py first).
+    A pickled copy is kept under .cache/blast_radius/ and reused until it changes.
 
 Exit codes:
     0 = success
@@ -24,11 +25,17 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
+import pickle
 import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
+from _jsonio import json_loads, print_json
+
 # ---------------------------------------------------------------------------
 # Project root detection
 # ---------------------------------------------------------------------------
@@ -45,6 +52,35 @@ def _find_project_root() -> Path:
 # Catalog loading
 # ---------------------------------------------------------------------------
 
+def _catalog_cache_path(root: Path, catalog_path: Path) -> Path:
+    """Pickle mirror of the catalog: one file per catalog path, overwritten on change."""
+    digest = hashlib.sha1(str(catalog_path.resolve()).encode("utf-8")).hexdigest()
+    return root / ".cache" / "blast_radius" / f"{digest}.pkl"
+
+
+def _load_catalog_cache(cache_path: Path, stamp: tuple[int, int]) -> dict[str, Any] | None:
+    """Return the cached catalog if it was stored for this (mtime_ns, size) stamp."""
+    try:
+        with cache_path.open("rb") as fh:
+            cached_stamp, data = pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError, TypeError, ValueError):
+        return None
+    if cached_stamp != stamp or not isinstance(data, dict):
+        return None
+    return data
+
+
+def _store_catalog_cache(cache_path: Path, stamp: tuple[int, int], data: dict[str, Any]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as fh:
+            pickle.dump((stamp, data), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
+
 def load_catalog(root: Path) -> dict[str, Any] | None:
     catalog_path = root / "data" / "code_catalog.json"
     if not catalog_path.exists():
@@ -57,8 +93,16 @@ def load_catalog(root: Path) -> dict[str, Any] | None:
             file=sys.stderr,
         )
         return None
+    # Reuse the pickled copy while the JSON file is unchanged; unpickling skips
+    # tokenizing a catalog that is re-read on every CI invocation.
+    cache_path = _catalog_cache_path(root, catalog_path)
+    st = catalog_path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _load_catalog_cache(cache_path, stamp)
+    if cached is not None:
+        return cached
     try:
-        data = json.loads(catalog_path.read_text())
+        data = json_loads(catalog_path.read_text())
     except json.JSONDecodeError as exc:
         print(
             f"[measure_blast_radius] ERROR: invalid JSON in {catalog_path}: {exc}",
@@ -71,6 +115,7 @@ def load_catalog(root: Path) -> dict[str, Any] | None:
             file=sys.stderr,
         )
         return None
+    _store_catalog_cache(cache_path, stamp, data)
     return data
 
 
@@ -78,6 +123,16 @@ def load_catalog(root: Path) -> dict[str, Any] | None:
 # Target resolution
 # ---------------------------------------------------------------------------
 
+def _build_suffix_index(files: set[str]) -> dict[str, list[str]]:
+    """Map each trailing run of path components to the files that end with it."""
+    index: dict[str, list[str]] = defaultdict(list)
+    for file_name in sorted(files):
+        parts = file_name.split(os.sep)
+        for i in range(len(parts)):
+            index[os.sep.join(parts[i:])].append(file_name)
+    return index
+
+
 def resolve_target(target_arg: str, root: Path, modules: list[dict[str, Any]]) -> str | None:
     """Normalize target to the 'file' key used in the catalog."""
     known_files: set[str] = set()
@@ -114,8 +169,15 @@ def resolve_target(target_arg: str, root: Path, modules: list[dict[str, Any]]) -
     if rel in known_files:
         return rel
 
-    # 4. Suffix match (partial path)
-    matches: list[str] = [f for f in known_files if f.endswith(rel) or rel.endswith(f)]
+    # 4. Suffix match (partial path): files ending with the given path, then files
+    # the given path ends with (e.g. an absolute path into another checkout).
+    suffix_index = _build_suffix_index(known_files)
+    rel_parts = rel.split(os.sep)
+    matches: list[str] = list(suffix_index.get(rel, []))
+    for i in range(1, len(rel_parts)):
+        tail = os.sep.join(rel_parts[i:])
+        if tail in known_files:
+            matches.append(tail)
     if len(matches) == 1:
         print(
             f"[measure_blast_radius] Resolved '{target_arg}' -> '{matches[0]}'",
@@ -136,6 +198,38 @@ def resolve_target(target_arg: str, root: Path, modules: list[dict[str, Any]]) -
 # Import graph construction
 # ---------------------------------------------------------------------------
 
+class _ModuleTrieNode:
+    """One dotted-name component; ``file`` is set if a catalog module ends here."""
+
+    __slots__ = ("children", "file")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _ModuleTrieNode] = {}
+        self.file: str | None = None
+
+
+def _trie_matches(trie: _ModuleTrieNode, imp: str) -> list[str]:
+    """Files of catalog modules equal to, above, or below the dotted name ``imp``."""
+    matches: list[str] = []
+    node = trie
+    for part in imp.split("."):
+        child = node.children.get(part)
+        if child is None:
+            return matches
+        node = child
+        # Exact match, or a module this import is a sub-module of.
+        if node.file is not None:
+            matches.append(node.file)
+    # Modules below the import (``import pkg`` reaches ``pkg.sub``).
+    stack = list(node.children.values())
+    while stack:
+        node = stack.pop()
+        if node.file is not None:
+            matches.append(node.file)
+        stack.extend(node.children.values())
+    return matches
+
+
 def build_reverse_import_graph(modules: list[dict[str, Any]]) -> dict[str, list[str]]:
     """Build a map: file -> list of files that import it (direct dependents)."""
     name_to_file: dict[str, str] = {}
@@ -148,6 +242,17 @@ def build_reverse_import_graph(modules: list[dict[str, Any]]) -> dict[str, list[
             if isinstance(module_name, str):
                 name_to_file[module_name] = file_name
 
+    # Index module names by dotted component, so each import resolves by walking
+    # its own components instead of testing every catalog module name.
+    trie = _ModuleTrieNode()
+    for mod_name, mod_file in name_to_file.items():
+        node = trie
+        for part in mod_name.split("."):
+            node = node.children.setdefault(part, _ModuleTrieNode())
+        node.file = mod_file
+    matches_by_import: dict[str, list[str]] = {}
+    dependent_sets: dict[str, set[str]] = {f: set() for f in imported_by}
+
     for module in modules:
         source_file = module.get("file")
         if not isinstance(source_file, str):
@@ -157,16 +262,16 @@ def build_reverse_import_graph(modules: list[dict[str, Any]]) -> dict[str, list[
         for imp in imports:
             if not isinstance(imp, str):
                 continue
-            # Find all catalog modules whose name matches this import
-            # (exact match or the import is a sub-module of the catalog module)
-            for mod_name, mod_file in name_to_file.items():
+            matched = matches_by_import.get(imp)
+            if matched is None:
+                matched = matches_by_import[imp] = _trie_matches(trie, imp)
+            for mod_file in matched:
                 if mod_file == source_file:
                     continue
-                if mod_name == imp or imp.startswith(mod_name + ".") or mod_name.startswith(imp + "."):
-                    if mod_file in imported_by:
-                        dependents = imported_by[mod_file]
-                        if source_file not in dependents:
-                            dependents.append(source_file)
+                seen = dependent_sets[mod_file]
+                if source_file not in seen:
+                    seen.add(source_file)
+                    imported_by[mod_file].append(source_file)
 
     return imported_by
 
@@ -181,24 +286,44 @@ def compute_blast_radius(
     max_depth: int = 5,
 ) -> dict[str, Any]:
     """BFS from target to find all transitively affected files."""
-    # depth_map: file -> shallowest depth at which it was reached
-    depth_map: dict[str, int] = {target_file: 0}
+    # Number files in sorted order and pack the dependents into CSR form
+    # (indptr/indices), so the BFS works on small ints and sorting a level of
+    # indices sorts it by file name.
+    names: set[str] = {target_file}
+    for f, dependents in imported_by.items():
+        names.add(f)
+        names.update(dependents)
+    files = sorted(names)
+    file_idx = {f: i for i, f in enumerate(files)}
+    indptr = [0]
+    indices: list[int] = []
+    for f in files:
+        indices.extend(file_idx[d] for d in imported_by.get(f, ()))
+        indptr.append(len(indices))
+
+    target_idx = file_idx[target_file]
+    visited = bytearray(len(files))
+    visited[target_idx] = 1
+    # levels: depth -> files first reached at that depth
     levels: dict[int, list[str]] = {0: [target_file]}
-    frontier = {target_file}
+    frontier = [target_idx]
 
     for depth in range(1, max_depth + 1):
-        next_frontier: set[str] = set()
+        next_frontier: list[int] = []
         for f in frontier:
-            for dependent in imported_by.get(f, []):
-                if dependent not in depth_map:
-                    depth_map[dependent] = depth
-                    next_frontier.add(dependent)
-        levels[depth] = sorted(next_frontier)
+            for dependent in indices[indptr[f] : indptr[f + 1]]:
+                if not visited[dependent]:
+                    visited[dependent] = 1
+                    next_frontier.append(dependent)
+        next_frontier.sort()
+        levels[depth] = [files[i] for i in next_frontier]
         frontier = next_frontier
         if not frontier:
             break
 
-    affected = sorted(f for f in depth_map if f != target_file)
+    # depth_map: file -> shallowest depth at which it was reached
+    depth_map = {f: depth for depth, level in levels.items() for f in level}
+    affected = [f for i, f in enumerate(files) if visited[i] and i != target_idx]
     direct = levels.get(1, [])
 
     return {
@@ -280,7 +405,7 @@ def main() -> None:
         file=sys.stderr,
     )
 
-    print(json.dumps(result, indent=2))
+    print_json(result)
 
 
 if __name__ == "__main__":
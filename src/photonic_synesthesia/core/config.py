@@ -7,6 +7,8 @@ variable support and YAML file loading.
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
 from typing import Any, cast
 
@@ -14,6 +16,10 @@ import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# libyaml-backed loader/dumper when PyYAML was built with it; same safe subset.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class AudioConfig(BaseModel):
     """Audio capture and analysis configuration."""
@@ -185,29 +191,49 @@ class Settings(BaseSettings):
     @classmethod
     def from_yaml(cls, path: Path) -> Settings:
         """Load settings from a YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f)
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
         return cls(**(data or {}))
 
     def to_yaml(self, path: Path) -> None:
         """Save settings to a YAML file."""
         with open(path, "w") as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False)
+            yaml.dump(
+                self.model_dump(mode="json"), f, Dumper=_YAML_DUMPER, default_flow_style=False
+            )
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_config_file(path: str, fmt: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML/JSON file; ``mtime_ns`` and ``size`` only key the cache."""
+    import json
+
+    # Files are handed over as bytes: json and libyaml detect the encoding themselves,
+    # so no text-layer decode (or locale dependence) sits in between.
+    with open(path, "rb") as f:
+        if fmt == "json":
+            return json.load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _load_config_file(path: Path, fmt: str) -> Any:
+    # Fixtures share a handful of profiles, so each file is parsed once until it
+    # changes on disk; callers get their own copy to mutate.
+    st = path.stat()
+    return copy.deepcopy(_parse_config_file(str(path.absolute()), fmt, st.st_mtime_ns, st.st_size))
+
+
+def clear_profile_cache() -> None:
+    """Forget cached fixture profiles and scenes, e.g. before a hot reload."""
+    _parse_config_file.cache_clear()
 
 
 def load_fixture_profile(profile_path: Path) -> dict[str, Any]:
     """Load a fixture profile from YAML."""
-    with open(profile_path) as f:
-        return cast(dict[str, Any], yaml.safe_load(f))
+    return cast(dict[str, Any], _load_config_file(profile_path, "yaml"))
 
 
 def load_scene(scene_path: Path) -> dict[str, Any]:
     """Load a scene definition from JSON/YAML."""
-    import json
-
-    if scene_path.suffix == ".json":
-        with open(scene_path) as f:
-            return cast(dict[str, Any], json.load(f))
-    else:
-        with open(scene_path) as f:
-            return cast(dict[str, Any], yaml.safe_load(f))
+    fmt = "json" if scene_path.suffix == ".json" else "yaml"
+    return cast(dict[str, Any], _load_config_file(scene_path, fmt))
@@ -7,6 +7,7 @@ state machine, containing all sensor data, analysis results, and control signals
 
 from __future__ import annotations
 
+import functools
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -47,7 +48,7 @@ class AudioFeatures(TypedDict):
     low_energy: float  # 20-200 Hz
     mid_energy: float  # 200-2000 Hz
     high_energy: float  # 2000+ Hz
-    mfcc_vector: list[float]
+    mfcc_vector: np.ndarray  # float32, one mean per coefficient
 
 
 class BeatInfo(TypedDict):
@@ -147,7 +148,7 @@ class PhotonicState(TypedDict):
     frame_number: int  # Processing frame counter
 
     # Raw Audio Buffer (for analysis nodes)
-    audio_buffer: list[float]  # Recent audio samples
+    audio_buffer: np.ndarray  # Recent mono float32 samples, oldest first
     sample_rate: int  # Audio sample rate (typically 48000)
 
     # Extracted Audio Features
@@ -187,7 +188,7 @@ class PhotonicState(TypedDict):
     fixture_commands: list[FixtureCommand]
 
     # DMX Universe Buffer
-    dmx_universe: bytes  # Start code + 512 channel slots
+    dmx_universe: bytearray  # Start code + 512 channel slots, updated in place
 
     # Safety Status
     safety_state: SafetyState
@@ -206,7 +207,7 @@ def create_initial_state() -> PhotonicState:
         timestamp=now,
         frame_number=0,
         # Audio
-        audio_buffer=[],
+        audio_buffer=np.zeros(0, dtype=np.float32),
         sample_rate=48000,
         audio_features=AudioFeatures(
             rms_energy=0.0,
@@ -216,7 +217,7 @@ def create_initial_state() -> PhotonicState:
             low_energy=0.0,
             mid_energy=0.0,
             high_energy=0.0,
-            mfcc_vector=[0.0] * 13,
+            mfcc_vector=np.zeros(13, dtype=np.float32),
         ),
         # Beat
         beat_info=BeatInfo(
@@ -286,7 +287,7 @@ def create_initial_state() -> PhotonicState:
         ),
         # Fixture output
         fixture_commands=[],
-        dmx_universe=bytes(create_universe_buffer()),  # Start code + 512 channels
+        dmx_universe=create_universe_buffer(),  # Start code + 512 channels
         # Safety
         safety_state=SafetyState(
             ok=True,
@@ -308,50 +309,107 @@ def create_initial_state() -> PhotonicState:
     )
 
 
-@dataclass
+# Integer codes for storing MusicStructure values in a NumPy buffer.
+_STRUCTURES = tuple(MusicStructure)
+_STRUCTURE_CODES = {structure: code for code, structure in enumerate(_STRUCTURES)}
+
+
+@functools.lru_cache(maxsize=32)
+def _centered_ramp(window: int) -> tuple[np.ndarray, float]:
+    """Sample indices centred on their mean, and their sum of squares, for a window."""
+    xc = np.arange(window) - (window - 1) / 2
+    xc.flags.writeable = False
+    return xc, float(np.dot(xc, xc))
+
+
+@dataclass(eq=False)
 class StateHistory:
     """
     Maintains a rolling history of state for temporal analysis.
 
     Used for structure detection (detecting trends over time) and
     for graceful degradation (using historical data when sensors fail).
+
+    Each series is a preallocated ring buffer of twice ``max_history`` slots;
+    every sample is written to slot ``i`` and ``i + max_history``, so the most
+    recent samples are always one contiguous slice and queries never copy.
+    The ``*_history`` and ``timestamps`` properties return snapshot lists.
     """
 
     max_history: int = 500  # ~10 seconds at 50Hz
 
-    rms_history: list[float] = field(default_factory=list)
-    spectral_centroid_history: list[float] = field(default_factory=list)
-    bpm_history: list[float] = field(default_factory=list)
-    structure_history: list[MusicStructure] = field(default_factory=list)
-    timestamps: list[float] = field(default_factory=list)
+    _rms: np.ndarray = field(init=False, repr=False)
+    _spectral_centroid: np.ndarray = field(init=False, repr=False)
+    _bpm: np.ndarray = field(init=False, repr=False)
+    _structure: np.ndarray = field(init=False, repr=False)
+    _timestamps: np.ndarray = field(init=False, repr=False)
+    _cursor: int = field(init=False, default=0)
+    _count: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        if self.max_history < 1:
+            raise ValueError("max_history must be at least 1")
+        slots = 2 * self.max_history
+        self._rms = np.zeros(slots)
+        self._spectral_centroid = np.zeros(slots)
+        self._bpm = np.zeros(slots)
+        self._structure = np.zeros(slots, dtype=np.int8)
+        self._timestamps = np.zeros(slots)
 
     def append(self, state: PhotonicState) -> None:
-        """Add current state to history, maintaining max size."""
-        self.rms_history.append(state["audio_features"]["rms_energy"])
-        self.spectral_centroid_history.append(state["audio_features"]["spectral_centroid"])
-        self.bpm_history.append(state["beat_info"]["bpm"])
-        self.structure_history.append(state["current_structure"])
-        self.timestamps.append(state["timestamp"])
-
-        # Trim to max size
-        if len(self.timestamps) > self.max_history:
-            self.rms_history = self.rms_history[-self.max_history :]
-            self.spectral_centroid_history = self.spectral_centroid_history[-self.max_history :]
-            self.bpm_history = self.bpm_history[-self.max_history :]
-            self.structure_history = self.structure_history[-self.max_history :]
-            self.timestamps = self.timestamps[-self.max_history :]
+        """Add current state to history, overwriting the oldest entry once full."""
+        i = self._cursor
+        j = i + self.max_history
+        features = state["audio_features"]
+        self._rms[i] = self._rms[j] = features["rms_energy"]
+        self._spectral_centroid[i] = self._spectral_centroid[j] = features["spectral_centroid"]
+        self._bpm[i] = self._bpm[j] = state["beat_info"]["bpm"]
+        self._structure[i] = self._structure[j] = _STRUCTURE_CODES[state["current_structure"]]
+        self._timestamps[i] = self._timestamps[j] = state["timestamp"]
+        self._cursor = i + 1 if i + 1 < self.max_history else 0
+        self._count = min(self._count + 1, self.max_history)
+
+    def _recent(self, buffer: np.ndarray, window: int) -> np.ndarray:
+        """Read-only view of ``history[-window:]`` (so ``window <= 0`` follows slice rules)."""
+        start, _, _ = slice(-window, None).indices(self._count)
+        end = self._cursor + self.max_history
+        view = buffer[end - self._count + start : end]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def rms_history(self) -> list[float]:
+        return self._recent(self._rms, 0).tolist()
+
+    @property
+    def spectral_centroid_history(self) -> list[float]:
+        return self._recent(self._spectral_centroid, 0).tolist()
+
+    @property
+    def bpm_history(self) -> list[float]:
+        return self._recent(self._bpm, 0).tolist()
+
+    @property
+    def structure_history(self) -> list[MusicStructure]:
+        return [_STRUCTURES[code] for code in self._recent(self._structure, 0)]
+
+    @property
+    def timestamps(self) -> list[float]:
+        return self._recent(self._timestamps, 0).tolist()
 
     def get_rms_trend(self, window: int = 100) -> float:
         """Calculate RMS slope over recent window (positive = rising)."""
-        if len(self.rms_history) < window:
+        if self._count < window:
+            return 0.0
+        recent = self._recent(self._rms, window)
+        # Least-squares slope against sample index: cov(x, y) / var(x).
+        xc, denom = _centered_ramp(len(recent))
+        if not denom:
             return 0.0
-        recent = self.rms_history[-window:]
-        coeffs = np.polyfit(range(len(recent)), recent, 1)
-        return float(coeffs[0])
+        return float(np.dot(xc, recent) / denom)
 
     def get_average_bpm(self, window: int = 50) -> float:
         """Get average BPM over recent window."""
-        if not self.bpm_history:
+        if not self._count:
             return 128.0
-        recent = self.bpm_history[-window:]
-        return float(np.mean(recent))
+        return float(np.mean(self._recent(self._bpm, window)))
@@ -7,8 +7,8 @@ low-latency operation. Maintains a ring buffer of recent samples.
 
 from __future__ import annotations
 
+import threading
 import time
-from collections import deque
 
 import numpy as np
 import structlog
@@ -44,8 +44,12 @@ class AudioSenseNode:
         self.block_size = config.block_size
         self.buffer_size = int(config.buffer_seconds * config.sample_rate)
 
-        # Ring buffer for samples (thread-safe via deque)
-        self._buffer: deque[float] = deque(maxlen=self.buffer_size)
+        # Mirrored ring buffer: every block is written at ``pos`` and
+        # ``pos + buffer_size``, so the latest samples are one contiguous slice.
+        self._ring = np.zeros(2 * self.buffer_size, dtype=np.float32)
+        self._write_pos = 0
+        self._filled = 0
+        self._lock = threading.Lock()
 
         # Stream handle
         self._stream: sd.InputStream | None = None
@@ -66,7 +70,7 @@ class AudioSenseNode:
         """
         PortAudio callback - runs in dedicated audio thread.
 
-        Must be fast and non-blocking. Only appends to ring buffer.
+        Must be fast and non-blocking. Only writes into the ring buffer.
         """
         if status.input_overflow:
             self._overflows += 1
@@ -77,10 +81,33 @@ class AudioSenseNode:
         else:
             mono = indata.flatten()
 
-        # Append to ring buffer (deque is thread-safe for append)
-        self._buffer.extend(mono.tolist())
+        self._write_samples(mono)
         self._callback_count += 1
 
+    def _write_samples(self, samples: NDArray[np.float32]) -> None:
+        """Write a block into the ring buffer, keeping both halves in sync."""
+        size = self.buffer_size
+        samples = samples[-size:]
+        n = len(samples)
+        with self._lock:
+            pos = self._write_pos
+            end = pos + n
+            self._ring[pos:end] = samples
+            if end <= size:
+                self._ring[pos + size : end + size] = samples
+            else:
+                # Block wraps: mirror its head at the top, its tail at the start.
+                self._ring[pos + size :] = samples[: size - pos]
+                self._ring[: end - size] = samples[size - pos :]
+            self._write_pos = end % size
+            self._filled = min(self._filled + n, size)
+
+    def _snapshot(self) -> NDArray[np.float32]:
+        """Copy of buffered samples in chronological order (oldest first)."""
+        with self._lock:
+            end = self._write_pos + self.buffer_size
+            return self._ring[end - self._filled : end].copy()
+
     def start(self) -> None:
         """Start audio capture stream."""
         if not SOUNDDEVICE_AVAILABLE:
@@ -155,11 +182,10 @@ class AudioSenseNode:
         state["timestamp"] = time.time()
         state["frame_number"] += 1
 
-        # Copy current buffer contents
-        if self._buffer:
-            # Get last N samples for analysis
-            buffer_list = list(self._buffer)
-            state["audio_buffer"] = buffer_list
+        # Snapshot current buffer contents
+        samples = self._snapshot()
+        if len(samples):
+            state["audio_buffer"] = samples
             state["sample_rate"] = self.sample_rate
             state["sensor_status"]["audio"] = True
         else:
@@ -182,5 +208,5 @@ class AudioSenseNode:
             "running": self._running,
             "callbacks": self._callback_count,
             "overflows": self._overflows,
-            "buffer_fill": len(self._buffer) / self.buffer_size,
+            "buffer_fill": self._filled / self.buffer_size,
         }
@@ -109,7 +109,7 @@ class BeatTrackNode:
 
         try:
             # Process audio through beat detector
-            y = np.array(audio_buffer[-4096:], dtype=np.float32)  # Last ~85ms at 48kHz
+            y = np.asarray(audio_buffer[-4096:], dtype=np.float32)  # Last ~85ms at 48kHz
 
             if BEATNET_AVAILABLE and hasattr(self._processor, "process"):
                 # BeatNet returns (beat_time, downbeat_flag) or None
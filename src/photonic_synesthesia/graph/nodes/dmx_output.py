@@ -257,8 +257,8 @@ class DMXOutputNode:
                         # Clamp value to valid range
                         self._universe[channel] = max(0, min(255, int(fval)))
 
-            # Copy to state
-            state["dmx_universe"] = bytes(self._universe)
+            # Copy into the state's buffer in place
+            state["dmx_universe"][:] = self._universe
 
         # Clear processed commands
         state["fixture_commands"] = []
@@ -74,8 +74,8 @@ class FeatureExtractNode:
             return state
 
         try:
-            # Convert to numpy array
-            y = np.array(audio_buffer, dtype=np.float32)
+            # Already float32 from audio_sense; asarray only converts other inputs
+            y = np.asarray(audio_buffer, dtype=np.float32)
             sr = state.get("sample_rate", 48000)
 
             # Compute features
@@ -134,7 +134,7 @@ class FeatureExtractNode:
 
         # MFCCs (timbral fingerprint)
         mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=self.n_mfcc)
-        mfcc_vector = mfcc.mean(axis=1).tolist()
+        mfcc_vector = mfcc.mean(axis=1).astype(np.float32)
 
         return AudioFeatures(
             rms_energy=rms_mean,
@@ -157,6 +157,6 @@ class FeatureExtractNode:
             low_energy=0.0,
             mid_energy=0.0,
             high_energy=0.0,
-            mfcc_vector=[0.0] * self.n_mfcc,
+            mfcc_vector=np.zeros(self.n_mfcc, dtype=np.float32),
         )
         return state
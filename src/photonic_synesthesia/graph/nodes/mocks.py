@@ -11,6 +11,7 @@ import math
 import random
 import time
 
+import numpy as np
 import structlog
 
 from photonic_synesthesia.core.state import (
@@ -81,7 +82,7 @@ class MockAudioSenseNode:
 
             buffer.append(base + kick + noise)
 
-        state["audio_buffer"] = buffer
+        state["audio_buffer"] = np.array(buffer, dtype=np.float32)
         state["sensor_status"]["audio"] = True
 
         # Also set synthetic features for faster testing
@@ -96,7 +97,7 @@ class MockAudioSenseNode:
             low_energy=0.6 + 0.3 * math.sin(beat_phase * math.pi),
             mid_energy=0.4,
             high_energy=0.2,
-            mfcc_vector=[0.0] * 13,
+            mfcc_vector=np.zeros(13, dtype=np.float32),
         )
 
         state["beat_info"] = BeatInfo(
@@ -192,7 +193,7 @@ class MockDMXOutputNode:
                 if is_valid_dmx_channel(channel):
                     self._universe[channel] = max(0, min(255, value))
 
-        state["dmx_universe"] = bytes(self._universe)
+        state["dmx_universe"][:] = self._universe
         state["fixture_commands"] = []
         self._frames_sent += 1
 
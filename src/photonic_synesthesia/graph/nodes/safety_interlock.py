@@ -18,7 +18,7 @@ from typing import Protocol
 
 from photonic_synesthesia.core.config import FixtureConfig, SafetyConfig
 from photonic_synesthesia.core.state import PhotonicState, SafetyState
-from photonic_synesthesia.dmx.universe import create_universe_buffer, is_valid_dmx_channel
+from photonic_synesthesia.dmx.universe import DMX_CHANNEL_MIN, is_valid_dmx_channel
 
 try:
     import structlog
@@ -154,7 +154,7 @@ class SafetyInterlockNode:
         start_time = time.time()
         current_time = state["timestamp"]
 
-        universe = bytearray(state["dmx_universe"])
+        universe = state["dmx_universe"]
         safety_ok = True
         error_state = None
 
@@ -168,7 +168,7 @@ class SafetyInterlockNode:
             safety_ok = False
             error_state = f"heartbeat_timeout: {time_since_heartbeat:.2f}s"
             logger.warning("Heartbeat timeout", elapsed=time_since_heartbeat)
-            universe = self._emergency_blackout()
+            self._emergency_blackout(universe)
 
         # Update heartbeat
         self._last_heartbeat = current_time
@@ -181,7 +181,7 @@ class SafetyInterlockNode:
         if self._emergency_stop:
             safety_ok = False
             error_state = "emergency_stop_active"
-            universe = self._emergency_blackout()
+            self._emergency_blackout(universe)
 
         # =================================================================
         # Check 3: Laser Y-axis clamping
@@ -256,7 +256,6 @@ class SafetyInterlockNode:
         # =================================================================
         # Update state
         # =================================================================
-        state["dmx_universe"] = bytes(universe)
         state["safety_state"] = SafetyState(
             ok=safety_ok,
             last_heartbeat=current_time,
@@ -271,9 +270,9 @@ class SafetyInterlockNode:
 
         return state
 
-    def _emergency_blackout(self) -> bytearray:
-        """Set all channels to zero."""
-        return create_universe_buffer()
+    def _emergency_blackout(self, universe: bytearray) -> None:
+        """Set all channels to zero in place, keeping the start code."""
+        universe[DMX_CHANNEL_MIN:] = bytes(len(universe) - DMX_CHANNEL_MIN)
 
     def _derive_strobe_channels(self) -> set[int]:
         """
@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from photonic_synesthesia.core.config import AudioConfig
+from photonic_synesthesia.core.state import create_initial_state
+from photonic_synesthesia.graph.nodes.audio_sense import AudioSenseNode
+
+NO_OVERFLOW = SimpleNamespace(input_overflow=False)
+
+
+def _node(buffer_size: int) -> AudioSenseNode:
+    return AudioSenseNode(AudioConfig(sample_rate=buffer_size, buffer_seconds=1.0))
+
+
+def test_audio_buffer_is_empty_until_samples_arrive() -> None:
+    node = _node(8)
+    state = node(create_initial_state())
+
+    assert state["sensor_status"]["audio"] is False
+    assert len(state["audio_buffer"]) == 0
+
+
+def test_audio_buffer_keeps_latest_samples_across_wraparound() -> None:
+    node = _node(8)
+    samples = np.arange(23, dtype=np.float32)
+    # Uneven stereo blocks so writes straddle the end of the ring.
+    for start, stop in ((0, 5), (5, 11), (11, 14), (14, 23)):
+        block = samples[start:stop]
+        node._audio_callback(np.column_stack([block, block]), len(block), {}, NO_OVERFLOW)
+
+    state = node(create_initial_state())
+
+    assert state["sensor_status"]["audio"] is True
+    assert state["audio_buffer"].dtype == np.float32
+    np.testing.assert_array_equal(state["audio_buffer"], samples[-8:])
+
+
+def test_audio_buffer_snapshot_is_independent_of_later_writes() -> None:
+    node = _node(4)
+    node._audio_callback(np.ones(3, dtype=np.float32), 3, {}, NO_OVERFLOW)
+    snapshot = node(create_initial_state())["audio_buffer"]
+
+    node._audio_callback(np.zeros(4, dtype=np.float32), 4, {}, NO_OVERFLOW)
+
+    np.testing.assert_array_equal(snapshot, np.ones(3, dtype=np.float32))
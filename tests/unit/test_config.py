@@ -0,0 +1,102 @@
+import os
+from pathlib import Path
+
+import yaml
+
+from photonic_synesthesia.core.config import (
+    DMXConfig,
+    Settings,
+    clear_profile_cache,
+    load_fixture_profile,
+    load_scene,
+)
+
+CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
+
+
+def test_settings_yaml_round_trip(tmp_path: Path) -> None:
+    settings = Settings(
+        scenes_dir=tmp_path / "scenes",
+        dmx=DMXConfig(interface_type="artnet", universe=3),
+        debug=True,
+    )
+    path = tmp_path / "settings.yaml"
+
+    settings.to_yaml(path)
+    loaded = Settings.from_yaml(path)
+
+    assert loaded.scenes_dir == tmp_path / "scenes"
+    assert loaded.dmx.interface_type == "artnet"
+    assert loaded.dmx.universe == 3
+    assert loaded.debug is True
+
+
+def test_from_yaml_treats_empty_file_as_defaults(tmp_path: Path) -> None:
+    path = tmp_path / "empty.yaml"
+    path.write_text("")
+
+    assert Settings.from_yaml(path) == Settings()
+
+
+def test_fixture_profile_matches_safe_load() -> None:
+    profile_path = CONFIG_DIR / "fixtures" / "laser_generic_7ch.yaml"
+
+    with open(profile_path) as f:
+        expected = yaml.safe_load(f)
+
+    assert load_fixture_profile(profile_path) == expected
+
+
+def test_load_scene_reads_json_and_yaml(tmp_path: Path) -> None:
+    yaml_scene = tmp_path / "scene.yaml"
+    yaml_scene.write_text("name: drop\nintensity: 0.8\n")
+
+    assert load_scene(CONFIG_DIR / "scenes" / "drop_intense.json")["name"]
+    assert load_scene(yaml_scene) == {"name": "drop", "intensity": 0.8}
+
+
+def test_loaders_decode_utf8_independent_of_locale(tmp_path: Path) -> None:
+    profile_path = tmp_path / "profile.yaml"
+    profile_path.write_bytes("name: Café Laser\nchannels: 7\n".encode())
+    scene_path = tmp_path / "scene.json"
+    scene_path.write_bytes('{"name": "Café"}'.encode())
+
+    assert load_fixture_profile(profile_path) == {"name": "Café Laser", "channels": 7}
+    assert load_scene(scene_path) == {"name": "Café"}
+
+
+def test_fixture_profile_cache_returns_independent_copies(tmp_path: Path) -> None:
+    profile_path = tmp_path / "profile.yaml"
+    profile_path.write_text("channels: 7\nmodes: [auto, sound]\n")
+
+    first = load_fixture_profile(profile_path)
+    first["modes"].append("manual")
+
+    assert load_fixture_profile(profile_path) == {"channels": 7, "modes": ["auto", "sound"]}
+
+
+def test_fixture_profile_cache_reloads_changed_file(tmp_path: Path) -> None:
+    profile_path = tmp_path / "profile.yaml"
+    profile_path.write_text("channels: 7\n")
+    assert load_fixture_profile(profile_path) == {"channels": 7}
+
+    profile_path.write_text("channels: 9\n")
+    stat = profile_path.stat()
+    os.utime(profile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_fixture_profile(profile_path) == {"channels": 9}
+
+
+def test_clear_profile_cache_forces_reparse(tmp_path: Path) -> None:
+    scene_path = tmp_path / "scene.json"
+    scene_path.write_text('{"name": "a"}')
+    assert load_scene(scene_path) == {"name": "a"}
+
+    # Same size and mtime: only an explicit clear picks up the edit.
+    stat = scene_path.stat()
+    scene_path.write_text('{"name": "b"}')
+    os.utime(scene_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_scene(scene_path) == {"name": "a"}
+
+    clear_profile_cache()
+    assert load_scene(scene_path) == {"name": "b"}
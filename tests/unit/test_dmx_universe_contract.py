@@ -51,3 +51,18 @@ def test_dmx_output_ignores_out_of_range_channels() -> None:
     assert universe[1] == 123
     assert universe[0] == DMX_START_CODE
     assert universe[512] == 0
+
+
+def test_dmx_output_updates_state_universe_in_place() -> None:
+    node = DMXOutputNode(DMXConfig(interface_type="artnet"))
+    state = create_initial_state()
+    buffer = state["dmx_universe"]
+    state["fixture_commands"] = [
+        {"fixture_id": "fx1", "fixture_type": "laser", "channel_values": {7: 42}}
+    ]
+
+    result = node(state)
+
+    assert result["dmx_universe"] is buffer
+    assert isinstance(buffer, bytearray)
+    assert buffer[7] == 42
@@ -137,7 +137,7 @@ def test_safety_interlock_clamps_fixture_commands_y_axis() -> None:
     state = create_initial_state()
     state["beat_info"]["confidence"] = 1.0
     # dmx_universe starts zeroed (as it would when running before dmx_output)
-    state["dmx_universe"] = bytes(create_universe_buffer())
+    state["dmx_universe"] = create_universe_buffer()
     state["fixture_commands"] = [
         FixtureCommand(
             fixture_id="laser-1",
@@ -171,7 +171,7 @@ def test_safety_interlock_leaves_non_laser_commands_unchanged() -> None:
 
     state = create_initial_state()
     state["beat_info"]["confidence"] = 1.0
-    state["dmx_universe"] = bytes(create_universe_buffer())
+    state["dmx_universe"] = create_universe_buffer()
     state["fixture_commands"] = [
         FixtureCommand(
             fixture_id="panel-1",
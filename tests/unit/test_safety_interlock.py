@@ -45,7 +45,7 @@ def test_safety_interlock_uses_configured_laser_offsets() -> None:
     universe[101] = 240  # configured y offset
     universe[102] = 5  # configured speed offset
     universe[104] = 240  # old hardcoded y offset (+4) should be untouched
-    state["dmx_universe"] = bytes(universe)
+    state["dmx_universe"] = universe
     state["beat_info"]["confidence"] = 1.0
 
     result = node(state)
@@ -102,7 +102,7 @@ def test_strobe_duration_limit_enters_cooldown_and_suppresses_strobe_channels()
     ]
     universe = create_universe_buffer()
     universe[26] = 255
-    state["dmx_universe"] = bytes(universe)
+    state["dmx_universe"] = universe
     node(state)
 
     state = create_initial_state()
@@ -117,7 +117,7 @@ def test_strobe_duration_limit_enters_cooldown_and_suppresses_strobe_channels()
     ]
     universe = create_universe_buffer()
     universe[26] = 255
-    state["dmx_universe"] = bytes(universe)
+    state["dmx_universe"] = universe
     result = node(state)
 
     assert result["fixture_commands"][0]["channel_values"][26] == 0
@@ -140,7 +140,7 @@ def test_graceful_degradation_scales_output_on_low_beat_confidence() -> None:
     ]
     universe = create_universe_buffer()
     universe[50] = 200
-    state["dmx_universe"] = bytes(universe)
+    state["dmx_universe"] = universe
     result = node(state)
 
     # scale = max(0.35, 0.1 / 0.8) = 0.35
@@ -176,3 +176,18 @@ def test_graceful_degradation_keeps_laser_mode_channel_unchanged() -> None:
 
     assert result["fixture_commands"][0]["channel_values"][1] == 200
     assert result["fixture_commands"][0]["channel_values"][7] == 62
+
+
+def test_emergency_stop_blacks_out_state_universe_in_place() -> None:
+    node = SafetyInterlockNode(config=SafetyConfig(), fixtures=[])
+    node.trigger_emergency_stop()
+
+    state = create_initial_state()
+    state["beat_info"]["confidence"] = 1.0
+    universe = state["dmx_universe"]
+    universe[1:4] = b"\xff\x80\x10"
+    result = node(state)
+
+    assert result["dmx_universe"] is universe
+    assert universe == create_universe_buffer()
+    assert result["safety_state"]["emergency_stop"] is True
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from photonic_synesthesia.core.state import (
+    MusicStructure,
+    PhotonicState,
+    StateHistory,
+    create_initial_state,
+)
+
+
+def _frame(rms: float, bpm: float = 128.0, timestamp: float = 0.0) -> PhotonicState:
+    state = create_initial_state()
+    state["audio_features"]["rms_energy"] = rms
+    state["audio_features"]["spectral_centroid"] = rms * 1000.0
+    state["beat_info"]["bpm"] = bpm
+    state["current_structure"] = MusicStructure.DROP
+    state["timestamp"] = timestamp
+    return state
+
+
+def test_history_keeps_only_the_most_recent_frames() -> None:
+    history = StateHistory(max_history=5)
+
+    for i in range(12):
+        history.append(_frame(float(i), timestamp=float(i)))
+
+    assert list(history.rms_history) == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert list(history.timestamps) == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert len(history.bpm_history) == 5
+    assert len(history.spectral_centroid_history) == 5
+    assert list(history.structure_history) == [MusicStructure.DROP] * 5
+
+
+def test_rms_trend_needs_a_full_window() -> None:
+    history = StateHistory()
+    for i in range(9):
+        history.append(_frame(float(i)))
+
+    assert history.get_rms_trend(window=10) == 0.0
+
+
+def test_rms_trend_is_slope_of_most_recent_window() -> None:
+    history = StateHistory(max_history=50)
+    # Falling for a while, then rising by 0.5 per frame over the last 20 frames.
+    for i in range(30):
+        history.append(_frame(100.0 - i))
+    for i in range(20):
+        history.append(_frame(0.5 * i))
+
+    assert history.get_rms_trend(window=20) == pytest.approx(0.5)
+
+
+def test_average_bpm_uses_recent_window_and_defaults_when_empty() -> None:
+    history = StateHistory()
+    assert history.get_average_bpm() == 128.0
+
+    for bpm in (100.0, 120.0, 130.0, 140.0):
+        history.append(_frame(0.0, bpm=bpm))
+
+    assert history.get_average_bpm(window=2) == pytest.approx(135.0)
+    assert history.get_average_bpm(window=10) == pytest.approx(122.5)
+
+
+def test_windows_span_ring_buffer_wraparound() -> None:
+    history = StateHistory(max_history=8)
+    for i in range(19):
+        history.append(_frame(2.0 * i, bpm=float(i)))
+
+    # 19 frames into 8 slots: the last 6 straddle the write cursor.
+    assert list(history.bpm_history) == [float(i) for i in range(11, 19)]
+    assert history.get_average_bpm(window=6) == pytest.approx(15.5)
+    assert history.get_rms_trend(window=6) == pytest.approx(2.0)
+
+
+def test_history_properties_are_snapshots() -> None:
+    history = StateHistory(max_history=4)
+    history.append(_frame(1.0))
+
+    snapshot = history.rms_history
+    snapshot[0] = 5.0
+    for i in range(6):
+        history.append(_frame(float(i)))
+
+    assert snapshot == [5.0]
+    assert history.rms_history == [2.0, 3.0, 4.0, 5.0]
+
+
+def test_non_positive_window_follows_slice_semantics() -> None:
+    history = StateHistory(max_history=8)
+    for bpm in (100.0, 120.0, 130.0, 140.0):
+        history.append(_frame(float(bpm), bpm=bpm))
+
+    # Same as ``bpm_history[-window:]``: 0 covers everything, -1 drops the oldest.
+    assert history.get_average_bpm(window=0) == pytest.approx(122.5)
+    assert history.get_average_bpm(window=-1) == pytest.approx(130.0)
+    assert history.get_rms_trend(window=0) == pytest.approx(
+        np.polyfit(np.arange(4), [100.0, 120.0, 130.0, 140.0], 1)[0]
+    )
+
+
+def test_history_requires_positive_size() -> None:
+    with pytest.raises(ValueError):
+        StateHistory(max_history=0)
+
+
+def test_rms_trend_matches_least_squares_fit() -> None:
+    rng = np.random.default_rng(0)
+    history = StateHistory(max_history=64)
+    values = rng.normal(size=100)
+    for value in values:
+        history.append(_frame(float(value)))
+
+    expected = np.polyfit(np.arange(40), values[-40:], 1)[0]
+    assert history.get_rms_trend(window=40) == pytest.approx(expected)
+    assert history.get_rms_trend(window=1) == 0.0